@@ -0,0 +1,34 @@
+"""Add feed discovery cache
+
+Revision ID: 4c7d2e91c001
+Revises: 3f0fb1c0c001
+Create Date: 2025-08-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "4c7d2e91c001"
+down_revision = "3f0fb1c0c001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "feeddiscovery",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("company", sa.String(length=128), unique=True, nullable=False),
+        sa.Column("homepage", sa.String(length=2048), nullable=False),
+        sa.Column("feeds", postgresql.JSONB, nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("sitemaps", postgresql.JSONB, nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("dead_urls", postgresql.JSONB, nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("discovered_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("validated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("feeddiscovery")
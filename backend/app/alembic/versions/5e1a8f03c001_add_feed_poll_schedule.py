@@ -0,0 +1,27 @@
+"""Add adaptive poll schedule to feed discovery
+
+Revision ID: 5e1a8f03c001
+Revises: 4c7d2e91c001
+Create Date: 2025-08-21 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5e1a8f03c001"
+down_revision = "4c7d2e91c001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("feeddiscovery", sa.Column("post_interval_seconds", sa.Float(), nullable=True))
+    op.add_column("feeddiscovery", sa.Column("last_polled_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("feeddiscovery", sa.Column("next_poll_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade():
+    op.drop_column("feeddiscovery", "next_poll_at")
+    op.drop_column("feeddiscovery", "last_polled_at")
+    op.drop_column("feeddiscovery", "post_interval_seconds")
@@ -0,0 +1,41 @@
+"""Add composite indexes for keyset pagination of scraped posts
+
+Revision ID: 6b3f9d27c001
+Revises: 5e1a8f03c001
+Create Date: 2025-08-22 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "6b3f9d27c001"
+down_revision = "5e1a8f03c001"
+branch_labels = None
+depends_on = None
+
+# Must match POST_SORT_PUBLISHED in app/api/routes/scraper.py
+FEED_ORDER = [
+    sa.text("coalesce(published_at, '-infinity'::timestamptz) DESC"),
+    sa.text("fetched_at DESC"),
+    sa.text("id DESC"),
+]
+
+
+def upgrade():
+    # One index per company/platform filter combination served by GET /scraper/posts/
+    op.create_index("ix_scrapedpost_feed", "scrapedpost", FEED_ORDER)
+    op.create_index("ix_scrapedpost_company_feed", "scrapedpost", [sa.text("company"), *FEED_ORDER])
+    op.create_index("ix_scrapedpost_platform_feed", "scrapedpost", [sa.text("platform"), *FEED_ORDER])
+    op.create_index(
+        "ix_scrapedpost_company_platform_feed",
+        "scrapedpost",
+        [sa.text("company"), sa.text("platform"), *FEED_ORDER],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_scrapedpost_company_platform_feed", table_name="scrapedpost")
+    op.drop_index("ix_scrapedpost_platform_feed", table_name="scrapedpost")
+    op.drop_index("ix_scrapedpost_company_feed", table_name="scrapedpost")
+    op.drop_index("ix_scrapedpost_feed", table_name="scrapedpost")
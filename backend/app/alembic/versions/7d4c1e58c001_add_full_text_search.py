@@ -0,0 +1,62 @@
+"""Add full-text search vectors to scraped posts and crawl pages
+
+Revision ID: 7d4c1e58c001
+Revises: 6b3f9d27c001
+Create Date: 2025-08-23 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d4c1e58c001"
+down_revision = "6b3f9d27c001"
+branch_labels = None
+depends_on = None
+
+# Keep in sync with TS_CONFIGS in app/api/search.py
+POST_CONFIG = """
+CASE lower(left(language, 2))
+    WHEN 'pt' THEN 'portuguese'::regconfig
+    WHEN 'en' THEN 'english'::regconfig
+    WHEN 'es' THEN 'spanish'::regconfig
+    WHEN 'fr' THEN 'french'::regconfig
+    WHEN 'de' THEN 'german'::regconfig
+    WHEN 'it' THEN 'italian'::regconfig
+    ELSE 'simple'::regconfig
+END
+"""
+
+
+def upgrade():
+    # Language-stemmed title (A) and content (B), plus unstemmed "simple" tokens so
+    # queries parsed without a language still match.
+    op.execute(
+        f"""
+        ALTER TABLE scrapedpost ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector({POST_CONFIG}, coalesce(title, '')), 'A')
+            || setweight(to_tsvector({POST_CONFIG}, coalesce(content, '')), 'B')
+            || to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(content, ''))
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE crawlpage ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple'::regconfig, coalesce(content_text, '')), 'B')
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_scrapedpost_search_vector", "scrapedpost", ["search_vector"], postgresql_using="gin"
+    )
+    op.create_index(
+        "ix_crawlpage_search_vector", "crawlpage", ["search_vector"], postgresql_using="gin"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_crawlpage_search_vector", table_name="crawlpage")
+    op.drop_index("ix_scrapedpost_search_vector", table_name="scrapedpost")
+    op.drop_column("crawlpage", "search_vector")
+    op.drop_column("scrapedpost", "search_vector")
@@ -0,0 +1,24 @@
+"""Add crawlpage (job_id, depth, fetched_at, id) index
+
+Revision ID: 8e2b7f64c001
+Revises: 7d4c1e58c001
+Create Date: 2025-08-24 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8e2b7f64c001"
+down_revision = "7d4c1e58c001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves GET /scraper/jobs/{job_id}/pages ordering and keyset cursor, with or
+    # without a depth filter, and the job_id foreign key lookups on job delete.
+    op.create_index("ix_crawlpage_job_crawl_order", "crawlpage", ["job_id", "depth", "fetched_at", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_crawlpage_job_crawl_order", table_name="crawlpage")
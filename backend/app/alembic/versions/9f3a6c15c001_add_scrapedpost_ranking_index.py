@@ -0,0 +1,36 @@
+"""Add stored content length and recency index for query-time post ranking
+
+Revision ID: 9f3a6c15c001
+Revises: 8e2b7f64c001
+Create Date: 2025-08-25 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9f3a6c15c001"
+down_revision = "8e2b7f64c001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Length term of the score without detoasting content for every candidate
+    op.execute(
+        "ALTER TABLE scrapedpost ADD COLUMN content_length integer "
+        "GENERATED ALWAYS AS (coalesce(length(content), 0)) STORED"
+    )
+    # GET /scraper/posts/top: per-company range scan over recency, carrying what the
+    # score formula needs so candidates are scored from the index alone
+    op.create_index(
+        "ix_scrapedpost_company_recency",
+        "scrapedpost",
+        [sa.text("company"), sa.text("coalesce(published_at, '-infinity'::timestamptz) DESC")],
+        postgresql_include=["published_at", "content_length", "id"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_scrapedpost_company_recency", table_name="scrapedpost")
+    op.drop_column("scrapedpost", "content_length")
@@ -0,0 +1,49 @@
+"""Add source table (company sources and their score weights)
+
+Revision ID: a2c7e5b8c001
+Revises: 9f3a6c15c001
+Create Date: 2025-08-26 00:00:00.000000
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "a2c7e5b8c001"
+down_revision = "9f3a6c15c001"
+branch_labels = None
+depends_on = None
+
+# Formerly DEFAULT_SOURCES in app/scraper/runner.py
+INITIAL_SOURCES = {
+    "laudos.ai": "https://laudos.ai/",
+    "laudos": "https://home.laudos.ai/",
+    "laudite": "https://laudite.com.br/",
+    "leorad": "https://leorad.com/",
+}
+
+
+def upgrade():
+    source = op.create_table(
+        "source",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("company", sa.String(length=128), unique=True, nullable=False),
+        sa.Column("homepage", sa.String(length=2048), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=False, server_default=sa.text("1.2")),
+        sa.Column("enabled", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.bulk_insert(
+        source,
+        [
+            {"id": uuid.uuid4(), "company": company, "homepage": homepage}
+            for company, homepage in INITIAL_SOURCES.items()
+        ],
+    )
+
+
+def downgrade():
+    op.drop_table("source")
@@ -0,0 +1,49 @@
+"""Add crawl link graph (crawllink edges and crawlpage.node_id)
+
+Revision ID: b4e1d9a7c001
+Revises: a2c7e5b8c001
+Create Date: 2025-08-27 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "b4e1d9a7c001"
+down_revision = "a2c7e5b8c001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("crawlpage", sa.Column("node_id", sa.Integer(), nullable=True))
+    # Score write-back joins on (job_id, node_id); only current-graph pages have one
+    op.create_index(
+        "ix_crawlpage_job_node",
+        "crawlpage",
+        ["job_id", "node_id"],
+        postgresql_where=sa.text("node_id IS NOT NULL"),
+    )
+    # GET /scraper/jobs/{job_id}/pages/top
+    op.create_index(
+        "ix_crawlpage_job_score",
+        "crawlpage",
+        [sa.text("job_id"), sa.text("score DESC NULLS LAST"), sa.text("id")],
+        postgresql_where=sa.text("node_id IS NOT NULL"),
+    )
+    op.create_table(
+        "crawllink",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("source", sa.Integer(), nullable=False),
+        sa.Column("target", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("job_id", "source", "target"),
+        sa.ForeignKeyConstraint(["job_id"], ["scrapejob.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade():
+    op.drop_table("crawllink")
+    op.drop_index("ix_crawlpage_job_score", table_name="crawlpage")
+    op.drop_index("ix_crawlpage_job_node", table_name="crawlpage")
+    op.drop_column("crawlpage", "node_id")
@@ -0,0 +1,44 @@
+"""Add SimHash fingerprints and LSH band indexes for near-duplicate detection
+
+Revision ID: c5f2a8e3c001
+Revises: b4e1d9a7c001
+Create Date: 2025-08-28 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "c5f2a8e3c001"
+down_revision = "b4e1d9a7c001"
+branch_labels = None
+depends_on = None
+
+# Must match app.scraper.simhash.band_sql (4 bands of 16 bits)
+BANDS = 4
+BAND_BITS = 16
+BAND_MASK = (1 << BAND_BITS) - 1
+
+
+def upgrade():
+    for table in ("scrapedpost", "crawlpage"):
+        op.add_column(table, sa.Column("simhash", sa.BigInteger(), nullable=True))
+        op.add_column(table, sa.Column("duplicate_of", postgresql.UUID(as_uuid=True), nullable=True))
+    # Banded LSH lookup over canonical posts: a near-duplicate shares at least one
+    # band with its original, so candidates come from four equality index scans
+    for band in range(BANDS):
+        op.create_index(
+            f"ix_scrapedpost_simhash_band{band}",
+            "scrapedpost",
+            [sa.text(f"((simhash >> {band * BAND_BITS}) & {BAND_MASK})")],
+            postgresql_where=sa.text("simhash IS NOT NULL AND duplicate_of IS NULL"),
+        )
+
+
+def downgrade():
+    for band in range(BANDS):
+        op.drop_index(f"ix_scrapedpost_simhash_band{band}", table_name="scrapedpost")
+    for table in ("scrapedpost", "crawlpage"):
+        op.drop_column(table, "duplicate_of")
+        op.drop_column(table, "simhash")
@@ -0,0 +1,59 @@
+"""Add crawl runs and per-run change records
+
+Revision ID: d6a3b0f4c001
+Revises: c5f2a8e3c001
+Create Date: 2025-08-29 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d6a3b0f4c001"
+down_revision = "c5f2a8e3c001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "crawlrun",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("number", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("stats", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.UniqueConstraint("job_id", "number", name="uq_crawlrun_job_number"),
+        # Deleting a job removes its runs, and with them their change records
+        sa.ForeignKeyConstraint(["job_id"], ["scrapejob.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_crawlrun_job_id", "crawlrun", ["job_id"])
+    op.create_table(
+        "crawlchange",
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("url_fp", sa.BigInteger(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("page_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.PrimaryKeyConstraint("run_id", "url_fp"),
+        sa.ForeignKeyConstraint(["run_id"], ["crawlrun.id"], ondelete="CASCADE"),
+    )
+    # "Changes since run X" reads only the churn, not the unchanged references
+    op.create_index(
+        "ix_crawlchange_churn",
+        "crawlchange",
+        ["run_id"],
+        postgresql_where=sa.text("kind <> 'unchanged'"),
+    )
+    op.add_column("crawlpage", sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column("crawlpage", sa.Column("content_hash", sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("crawlpage", "content_hash")
+    op.drop_column("crawlpage", "run_id")
+    op.drop_index("ix_crawlchange_churn", table_name="crawlchange")
+    op.drop_table("crawlchange")
+    op.drop_index("ix_crawlrun_job_id", table_name="crawlrun")
+    op.drop_table("crawlrun")
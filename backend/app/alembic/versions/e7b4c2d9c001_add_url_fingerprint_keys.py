@@ -0,0 +1,44 @@
+"""Replace full-URL indexes with 64-bit URL fingerprint keys
+
+Revision ID: e7b4c2d9c001
+Revises: d6a3b0f4c001
+Create Date: 2025-08-30 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e7b4c2d9c001"
+down_revision = "d6a3b0f4c001"
+branch_labels = None
+depends_on = None
+
+# Must match app.models.URL_FP_SQL / app.scraper.frontier.url_fingerprint
+URL_FP_SQL = "('x' || substr(md5(url), 1, 16))::bit(64)::bigint"
+
+
+def upgrade():
+    # Generated columns: adding them rewrites the table, which backfills every row,
+    # and they can never drift from the URL they are computed from
+    op.execute(f"ALTER TABLE scrapedpost ADD COLUMN url_fp bigint GENERATED ALWAYS AS ({URL_FP_SQL}) STORED")
+    op.execute(f"ALTER TABLE crawlpage ADD COLUMN url_fp bigint GENERATED ALWAYS AS ({URL_FP_SQL}) STORED")
+    # Posts: an 8-byte unique key instead of a unique B-tree over url varchar(2048).
+    # upsert_post looks rows up by url_fp and compares the URL to detect a collision.
+    op.create_index("ix_scrapedpost_url_fp", "scrapedpost", ["url_fp"], unique=True)
+    op.drop_constraint("scrapedpost_url_key", "scrapedpost", type_="unique")
+    # Crawl pages: several versions per URL, so a (non-unique) hash index
+    op.create_index("ix_crawlpage_url_fp", "crawlpage", ["url_fp"], postgresql_using="hash")
+    op.drop_index("ix_crawlpage_url", table_name="crawlpage")
+    op.drop_index("ix_crawlpage_normalized_url", table_name="crawlpage")
+    # Change records were keyed by the previous (blake2b) fingerprint
+    op.execute("UPDATE crawlchange SET url_fp = p.url_fp FROM crawlpage p WHERE p.id = crawlchange.page_id")
+
+
+def downgrade():
+    op.create_index("ix_crawlpage_normalized_url", "crawlpage", ["normalized_url"])
+    op.create_index("ix_crawlpage_url", "crawlpage", ["url"])
+    op.drop_index("ix_crawlpage_url_fp", table_name="crawlpage")
+    op.create_unique_constraint("scrapedpost_url_key", "scrapedpost", ["url"])
+    op.drop_index("ix_scrapedpost_url_fp", table_name="scrapedpost")
+    op.drop_column("crawlpage", "url_fp")
+    op.drop_column("scrapedpost", "url_fp")
@@ -0,0 +1,33 @@
+"""Store post content fingerprints and the entry URLs of each feed poll
+
+Revision ID: f8c5d3e1c001
+Revises: e7b4c2d9c001
+Create Date: 2025-09-02 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "f8c5d3e1c001"
+down_revision = "e7b4c2d9c001"
+branch_labels = None
+depends_on = None
+
+# Must match app.models.CONTENT_FP_SQL / app.scraper.utils.content_fingerprint
+CONTENT_FP_SQL = "md5(coalesce(title, '') || coalesce(content, ''))"
+
+
+def upgrade():
+    # Computed on write, so finding unchanged entries no longer hashes every stored post
+    op.execute(f"ALTER TABLE scrapedpost ADD COLUMN content_fp varchar(32) GENERATED ALWAYS AS ({CONTENT_FP_SQL}) STORED")
+    op.add_column(
+        "feeddiscovery",
+        sa.Column("entry_urls", postgresql.JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_column("feeddiscovery", "entry_urls")
+    op.drop_column("scrapedpost", "content_fp")
@@ -0,0 +1,80 @@
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+from sqlalchemy import Select, text
+from sqlmodel import SQLModel, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+count_cache: TTLCache[int] = TTLCache(
+    maxsize=1024, ttl=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+
+async def estimated_row_count(session: AsyncSession, table_name: str) -> int | None:
+    """Planner row estimate from pg_class; None if the table was never analyzed."""
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table_name},
+    )
+    reltuples = result.scalar()
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+async def table_count(session: AsyncSession, model: type[SQLModel]) -> int:
+    """Total rows of an unfiltered table: estimated when large, exact otherwise."""
+    table_name = str(model.__tablename__)
+    key = ("table", table_name)
+    cached = count_cache.get(key)
+    if cached is not None:
+        return cached
+    count = await estimated_row_count(session, table_name)
+    if count is None or count < settings.COUNT_ESTIMATE_THRESHOLD:
+        count = (await session.exec(select(func.count()).select_from(model))).one()
+    count_cache.set(key, count)
+    return count
+
+
+async def filtered_count(
+    session: AsyncSession, statement: Select[Any], key: Hashable
+) -> int:
+    """Exact count of ``statement`` (without ordering/paging), cached per ``key``."""
+    cached = count_cache.get(key)
+    if cached is not None:
+        return cached
+    count_statement = select(func.count()).select_from(
+        statement.order_by(None).subquery()
+    )
+    count = (await session.exec(count_statement)).one()
+    count_cache.set(key, count)
+    return count
+
+
+async def page_with_total(
+    session: AsyncSession,
+    statement: Select[Any],
+    key: Hashable,
+    *,
+    limit: int,
+    offset: int = 0,
+) -> tuple[Sequence[Any], int]:
+    """Fetch one page of a filtered query together with the filtered total.
+
+    The total comes from ``count(*) OVER ()`` in the same query, so no second scan is
+    needed; it is only re-counted separately when the page is past the end. Items are
+    the selected entity for a single-entity select, else dicts of the selected columns.
+    """
+    names = [d["name"] for d in statement.column_descriptions]
+    windowed = statement.add_columns(func.count().over().label("total"))
+    rows = (await session.exec(windowed.offset(offset).limit(limit))).all()  # type: ignore[call-overload]
+    if rows:
+        total = int(rows[0][-1])
+        count_cache.set(key, total)
+        if len(names) == 1:
+            return [row[0] for row in rows], total
+        return [dict(zip(names, row[:-1], strict=True)) for row in rows], total
+    return [], await filtered_count(session, statement, key)
@@ -1,16 +1,18 @@
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import async_engine, async_read_engine, engine
 from app.models import TokenPayload, User
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -26,6 +28,57 @@ def get_db() -> Generator[Session, None, None]:
 
 
 SessionDep = Annotated[Session, Depends(get_db)]
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    # Loaded attributes stay usable after commit (no implicit refresh I/O)
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+# Set on responses to writes; until it expires, that client's reads use the primary
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+
+def reads_primary(request: Request) -> bool:
+    """Whether reads for this request must see the primary (read-your-writes).
+
+    Clients opt in per request with ``X-Read-Primary: 1``; browsers get it for a
+    few seconds after each write through the cookie set by ``stick_to_primary``.
+    """
+    if request.headers.get("X-Read-Primary", "").lower() in {"1", "true", "yes"}:
+        return True
+    try:
+        return float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    bind = async_engine if reads_primary(request) else async_read_engine
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        yield session
+
+
+AsyncReadSessionDep = Annotated[AsyncSession, Depends(get_async_read_db)]
+
+
+def stick_to_primary(response: Response) -> None:
+    """Send this client's reads to the primary for a while after a write."""
+    if async_read_engine is async_engine:
+        return
+    max_age = settings.DATABASE_REPLICA_STICKY_SECONDS
+    response.set_cookie(
+        READ_PRIMARY_COOKIE,
+        f"{time.time() + max_age:.0f}",
+        max_age=max_age,
+        httponly=True,
+        samesite="lax",
+    )
+
+
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
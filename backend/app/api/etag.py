@@ -0,0 +1,43 @@
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import BigInteger, literal_column
+from sqlmodel import SQLModel
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from a version tuple (row versions, query parameters, ...)."""
+    payload = json.dumps(parts, default=str, separators=(",", ":")).encode()
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def row_version(model: type[SQLModel]) -> Any:
+    """Postgres ``xmin`` of a row as a bigint; it changes whenever the row is written."""
+    return literal_column(f"{model.__tablename__}.xmin::text::bigint", type_=BigInteger)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` lists ``etag`` (weak comparison, as RFC 9110 asks)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def cache_headers(etag: str, cache_control: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Response | None:
+    """A 304 response if the client already has ``etag``, else None."""
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag, cache_control))
+    return None
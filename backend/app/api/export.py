@@ -0,0 +1,202 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import uuid
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Any, Literal
+
+from fastapi import Request
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import Engine, Select
+from sqlalchemy import types as sa_types
+from sqlmodel import Session
+from starlette.background import BackgroundTask
+
+from app.api.deps import reads_primary
+from app.core.db import engine, read_engine
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Rows fetched per round trip from the server-side cursor (and written per chunk)
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def read_bind(request: Request) -> Engine:
+    """Engine for an export: the read replica unless the client needs its own writes."""
+    return engine if reads_primary(request) else read_engine
+
+
+def iter_row_batches(
+    statement: Select[Any],
+    batch_size: int = EXPORT_BATCH_SIZE,
+    *,
+    bind: Engine | None = None,
+) -> Iterator[Sequence[Any]]:
+    """Yield result rows in batches from a server-side cursor, in a session of its own.
+
+    Only ``batch_size`` rows are held at a time; rows are plain tuples, never ORM
+    objects. Reads from ``bind``, by default the read replica (if configured).
+    """
+    with Session(bind or read_engine) as session:
+        result = session.execute(statement.execution_options(yield_per=batch_size))
+        yield from result.partitions()
+
+
+def ndjson_chunks(
+    columns: list[str], batches: Iterable[Sequence[Any]]
+) -> Iterator[bytes]:
+    for batch in batches:
+        lines = (
+            json.dumps(
+                {c: _jsonable(v) for c, v in zip(columns, row, strict=True)},
+                ensure_ascii=False,
+                default=str,
+            )
+            for row in batch
+        )
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def csv_chunks(columns: list[str], batches: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in batches:
+        for row in batch:
+            writer.writerow(
+                json.dumps(v, default=str)
+                if isinstance(v, dict | list)
+                else _jsonable(v)
+                for v in row
+            )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_response(
+    request: Request, statement: Select[Any], *, format: ExportFormat, filename: str
+) -> StreamingResponse:
+    """Stream ``statement`` as NDJSON or CSV, gzip-compressed if the client accepts it."""
+    columns = [c.name for c in statement.selected_columns]
+    encode = ndjson_chunks if format == "ndjson" else csv_chunks
+    chunks = encode(columns, iter_row_batches(statement, bind=read_bind(request)))
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[format], headers=headers)
+
+
+# Rows per Parquet row group; each group is read from the cursor and written at once
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+
+def _arrow_type(column: Any) -> Any:
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+    sql_type = column.type
+    if isinstance(sql_type, sa_types.DateTime):
+        return pa.timestamp("us", tz="UTC" if sql_type.timezone else None)
+    if isinstance(sql_type, sa_types.Boolean):
+        return pa.bool_()
+    if isinstance(sql_type, sa_types.Integer):
+        return pa.int64()
+    if isinstance(sql_type, sa_types.Float | sa_types.Numeric):
+        return pa.float64()
+    # Strings, UUIDs and JSON documents (serialized) are stored as UTF-8 text
+    return pa.string()
+
+
+def _parquet_converter(column: Any, arrow_type: Any) -> Callable[[Any], Any] | None:
+    import pyarrow as pa
+
+    if isinstance(column.type, sa_types.JSON):
+        return lambda v: None if v is None else json.dumps(v, default=str)
+    if pa.types.is_string(arrow_type):
+        # e.g. UUIDs
+        return lambda v: v if v is None or isinstance(v, str) else str(v)
+    return None
+
+
+def write_parquet(
+    statement: Select[Any], path: str | os.PathLike[str], *, bind: Engine | None = None
+) -> int:
+    """Write the rows of ``statement`` to a Parquet file, one row group per batch.
+
+    Requires the optional ``pyarrow`` dependency (``analytics`` extra). Returns the
+    number of rows written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+    except ImportError:
+        raise RuntimeError(
+            "Parquet export requires pyarrow (install the 'analytics' extra)"
+        )
+
+    columns = list(statement.selected_columns)
+    schema = pa.schema([pa.field(c.name, _arrow_type(c)) for c in columns])
+    converters = [
+        _parquet_converter(c, field.type)
+        for c, field in zip(columns, schema, strict=True)
+    ]
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for batch in iter_row_batches(statement, PARQUET_ROW_GROUP_SIZE, bind=bind):
+            arrays = []
+            for i, convert in enumerate(converters):
+                values = [row[i] for row in batch]
+                if convert is not None:
+                    values = [convert(v) for v in values]
+                arrays.append(pa.array(values, type=schema.field(i).type))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            rows += len(batch)
+    return rows
+
+
+def parquet_response(
+    statement: Select[Any], *, filename: str, bind: Engine | None = None
+) -> FileResponse:
+    """Write ``statement`` to a temporary Parquet file and return it as a download."""
+    fd, path = tempfile.mkstemp(suffix=".parquet")
+    os.close(fd)
+    try:
+        write_parquet(statement, path, bind=bind)
+    except Exception:
+        os.remove(path)
+        raise
+    return FileResponse(
+        path,
+        media_type="application/vnd.apache.parquet",
+        filename=f"{filename}.parquet",
+        background=BackgroundTask(os.remove, path),
+    )
@@ -2,7 +2,7 @@ from fastapi import APIRouter
 
 from app.api.routes import items, login, private, users, utils
 from app.core.config import settings
-from app.api.routes import scraper
+from app.api.routes import scraper, sources
 from app.api.routes import examples
 
 api_router = APIRouter()
@@ -11,6 +11,7 @@ api_router.include_router(users.router)
 api_router.include_router(utils.router)
 api_router.include_router(items.router)
 api_router.include_router(scraper.router)
+api_router.include_router(sources.router)
 api_router.include_router(examples.router)
 
 
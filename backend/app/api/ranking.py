@@ -0,0 +1,115 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import DateTime, Integer, bindparam, case, literal_column, or_, select
+from sqlmodel import col, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import ScrapedPost
+from app.scraper.scoring import (
+    DEFAULT_SOURCE_WEIGHT,
+    LENGTH_WEIGHT,
+    RECENCY_WEIGHT,
+    UNKNOWN_DATE_RECENCY,
+    recency_cutoff_days,
+    score_sql,
+)
+
+# Generated column from migration 9f3a6c15c001 (not mapped on the model)
+POST_CONTENT_LENGTH = literal_column("scrapedpost.content_length", type_=Integer)
+# Must match the key of ix_scrapedpost_company_recency
+POST_RECENCY = func.coalesce(
+    ScrapedPost.published_at, literal_column("'-infinity'::timestamptz")
+)
+
+
+def _filtered(statement: Any, company: str | None, platform: str | None) -> Any:
+    if company:
+        statement = statement.where(ScrapedPost.company == company)
+    if platform:
+        statement = statement.where(ScrapedPost.platform == platform)
+    return statement
+
+
+def _weight(weights: Mapping[str, float], company: str | None) -> tuple[Any, float]:
+    """Source weight as a SQL expression, and the largest weight it can take."""
+    if company:
+        weight = weights.get(company, DEFAULT_SOURCE_WEIGHT)
+        return weight, weight
+    if not weights:
+        return DEFAULT_SOURCE_WEIGHT, DEFAULT_SOURCE_WEIGHT
+    expression = case(
+        dict(weights), value=ScrapedPost.company, else_=DEFAULT_SOURCE_WEIGHT
+    )
+    return expression, max(*weights.values(), DEFAULT_SOURCE_WEIGHT)
+
+
+async def top_posts(
+    session: AsyncSession,
+    weights: Mapping[str, float],
+    *,
+    company: str | None = None,
+    platform: str | None = None,
+    limit: int = 20,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Highest-scoring posts by the live ``score_post`` formula, computed in SQL.
+
+    The newest ``limit`` posts (an index range scan) give a lower bound for the
+    ``limit``-th best score; posts too old to reach it even at full length are then
+    excluded by a recency cutoff, so only the recent slice of the index is scored.
+    ``weights`` maps company to source weight.
+    """
+    now = now or datetime.now(timezone.utc)
+    now_param = bindparam("now", now, type_=DateTime(timezone=True))
+    weight, max_weight = _weight(weights, company)
+    score = score_sql(
+        ScrapedPost.published_at, POST_CONTENT_LENGTH, weight, now_param
+    ).label("score")
+
+    seed = (
+        _filtered(select(score), company, platform)
+        .order_by(POST_RECENCY.desc())
+        .limit(limit)
+    )
+    seed = seed.subquery()
+    floor_score, seeded = (
+        await session.execute(
+            select(func.min(seed.c.score), func.count()).select_from(seed)
+        )
+    ).one()
+
+    ranked = _filtered(
+        select(
+            col(ScrapedPost.id),
+            col(ScrapedPost.company),
+            col(ScrapedPost.platform),
+            col(ScrapedPost.url),
+            col(ScrapedPost.title),
+            col(ScrapedPost.language),
+            col(ScrapedPost.published_at),
+            col(ScrapedPost.fetched_at),
+            score,
+        ),
+        company,
+        platform,
+    )
+    cutoff = (
+        recency_cutoff_days(float(floor_score), max_weight)
+        if seeded >= limit and floor_score is not None
+        else None
+    )
+    if cutoff is not None:
+        recent = POST_RECENCY >= now - timedelta(days=cutoff)
+        if 100.0 * max_weight * (
+            RECENCY_WEIGHT * UNKNOWN_DATE_RECENCY + LENGTH_WEIGHT
+        ) < float(floor_score):
+            ranked = ranked.where(recent)
+        else:
+            # Undated posts can still make it on length alone
+            ranked = ranked.where(or_(recent, col(ScrapedPost.published_at).is_(None)))
+    ranked = ranked.order_by(
+        score.desc(), POST_RECENCY.desc(), col(ScrapedPost.id).desc()
+    ).limit(limit)
+    return [row._asdict() for row in await session.execute(ranked)]
@@ -1,10 +1,12 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.etag import cache_headers, make_etag, not_modified, row_version
+from app.core.config import settings
 from app.models import Item, ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
 
 router = APIRouter(prefix="/items", tags=["items"])
@@ -12,32 +14,35 @@ router = APIRouter(prefix="/items", tags=["items"])
 
 @router.get("/", response_model=ItemsPublic)
 def read_items(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    request: Request,
+    response: Response,
+    session: SessionDep,
+    current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
 ) -> Any:
     """
     Retrieve items.
-    """
 
-    if current_user.is_superuser:
-        count_statement = select(func.count()).select_from(Item)
-        count = session.exec(count_statement).one()
-        statement = select(Item).offset(skip).limit(limit)
-        items = session.exec(statement).all()
-    else:
-        count_statement = (
-            select(func.count())
-            .select_from(Item)
-            .where(Item.owner_id == current_user.id)
-        )
-        count = session.exec(count_statement).one()
-        statement = (
-            select(Item)
-            .where(Item.owner_id == current_user.id)
-            .offset(skip)
-            .limit(limit)
-        )
-        items = session.exec(statement).all()
+    The ETag comes from the item count and newest row version in scope, so an
+    unchanged list is answered with 304 before the items are even fetched.
+    """
 
+    # Count and latest row version in one query; any insert, update or delete moves one
+    count_statement = select(func.count(), func.max(row_version(Item))).select_from(
+        Item
+    )
+    statement = select(Item)
+    if not current_user.is_superuser:
+        count_statement = count_statement.where(Item.owner_id == current_user.id)
+        statement = statement.where(Item.owner_id == current_user.id)
+    count, version = session.exec(count_statement).one()
+    etag = make_etag("items", current_user.id, skip, limit, count, version)
+    unchanged = not_modified(request, etag, settings.CACHE_CONTROL_ITEMS)
+    if unchanged is not None:
+        return unchanged
+    items = session.exec(statement.offset(skip).limit(limit)).all()
+    response.headers.update(cache_headers(etag, settings.CACHE_CONTROL_ITEMS))
     return ItemsPublic(data=items, count=count)
 
 
@@ -1,15 +1,51 @@
-from datetime import datetime
-from typing import Any
+import uuid
+from datetime import datetime, timezone
+from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlmodel import Session, select, func
-
-from app.api.deps import get_current_active_superuser
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy import literal_column, tuple_
+from sqlalchemy.orm import load_only
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import AsyncReadSessionDep, AsyncSessionDep, get_current_active_superuser, stick_to_primary
 from app.api.deps import require_api_key, require_ip_allowlist
-from app.core.db import engine
+from app.api.export import ExportFormat, export_response, parquet_response, read_bind
+from app.api.counting import filtered_count, page_with_total, table_count
+from app.api.etag import body_etag, cache_headers, make_etag, not_modified, row_version
+from app.api.ranking import top_posts
+from app.api.search import search_pages, search_posts
+from app.api.serialize import dump_json, json_response, row_dicts
+from app.api.pagination import cursor_datetime, cursor_uuid, decode_cursor, encode_cursor
+from app.core.cache import TTLCache, posts_generation
 from app.core.config import settings
-from app.models import ScrapedPost, ScrapedPostPublic, ScrapedPostsPublic, ScrapeJob, ScrapeJobPublic, CrawlPage, CrawlPagesPublic
-from app.scraper.runner import run_scraping_for_company, bfs_crawl
+from app.models import (
+    CrawlChange,
+    CrawlChangesPublic,
+    CrawlPage,
+    CrawlPagesPublic,
+    CrawlPageSummariesPublic,
+    CrawlPageSummary,
+    CrawlRun,
+    CrawlRunPublic,
+    CrawlRunsPublic,
+    ScrapedPost,
+    ScrapedPostPublic,
+    ScrapedPostsPublic,
+    ScrapedPostSummariesPublic,
+    ScrapedPostSummary,
+    ScrapeJob,
+    ScrapeJobPublic,
+    SearchResults,
+    TopPostsPublic,
+)
+from app.scraper.changes import UNCHANGED, net_changes
+from app.scraper.frontier import url_fingerprint
+from app.scraper.rescore import rescore_blocking
+from app.scraper.runner import crawl_job_blocking, run_scraping_blocking
+from app.scraper.sources import sources
 import httpx
 from pydantic import BaseModel, Field
 
@@ -38,149 +74,526 @@ class CreateJobIn(BaseModel):
     webhook_url: str | None = None
 
 
+ListView = Literal["summary", "full"]
+# Listing responses differ by projection; ``view`` tells them apart
+ScrapedPostsOut = Annotated[ScrapedPostsPublic | ScrapedPostSummariesPublic, Field(discriminator="view")]
+CrawlPagesOut = Annotated[CrawlPagesPublic | CrawlPageSummariesPublic, Field(discriminator="view")]
+
+
+def _summary_columns(model: Any, summary: type[BaseModel]) -> Any:
+    """Loader option restricting the SELECT to the columns of a summary model."""
+    return load_only(*(getattr(model, name) for name in summary.model_fields if name != "id"))
+
+
+def _schema_columns(model: Any, schema: type[BaseModel]) -> list[Any]:
+    """Table columns for the fields of ``schema``, for selecting plain rows."""
+    return [model.__table__.c[name] for name in schema.model_fields]
+
+
 class JobsOut(BaseModel):
     data: list[ScrapeJobPublic]
     count: int
 
 
 @router.get("/jobs/", response_model=JobsOut, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
-async def list_jobs(limit: int = 50, offset: int = 0) -> JobsOut:
-    with Session(engine) as session:
-        stmt = select(ScrapeJob).offset(offset).limit(limit).order_by(ScrapeJob.created_at.desc())
-        items = session.exec(stmt).all()
-        # count simple
-        count = session.exec(select(func.count()).select_from(ScrapeJob)).one()
-        return JobsOut(data=[ScrapeJobPublic.model_validate(i) for i in items], count=count)
+async def list_jobs(session: AsyncReadSessionDep, limit: int = 50, offset: int = 0) -> Response:
+    stmt = (
+        select(*_schema_columns(ScrapeJob, ScrapeJobPublic))
+        .offset(offset)
+        .limit(limit)
+        .order_by(ScrapeJob.created_at.desc())
+    )
+    items = row_dicts(await session.execute(stmt))
+    count = await table_count(session, ScrapeJob)
+    return json_response(JobsOut, {"data": items, "count": count})
 
 
 @router.get("/jobs/{job_id}", response_model=ScrapeJobPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
-async def get_job(job_id: str) -> ScrapeJobPublic:
+async def get_job(request: Request, response: Response, session: AsyncReadSessionDep, job_id: str) -> Any:
+    """Job details; the ETag follows the row version, so polling clients get a 304
+    until the job's status or stats change."""
     from uuid import UUID
 
-    with Session(engine) as session:
-        job = session.get(ScrapeJob, UUID(job_id))
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-        return ScrapeJobPublic.model_validate(job)
+    row = (await session.exec(select(ScrapeJob, row_version(ScrapeJob)).where(ScrapeJob.id == UUID(job_id)))).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job, version = row
+    etag = make_etag("job", job_id, version)
+    unchanged = not_modified(request, etag, settings.CACHE_CONTROL_JOB)
+    if unchanged is not None:
+        return unchanged
+    response.headers.update(cache_headers(etag, settings.CACHE_CONTROL_JOB))
+    return ScrapeJobPublic.model_validate(job)
 
 
-@router.delete("/jobs/{job_id}", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
-async def delete_job(job_id: str) -> dict[str, Any]:
+@router.delete("/jobs/{job_id}", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser), Depends(stick_to_primary)])
+async def delete_job(session: AsyncSessionDep, job_id: str) -> dict[str, Any]:
     from uuid import UUID
 
-    with Session(engine) as session:
-        job = session.get(ScrapeJob, UUID(job_id))
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-        session.delete(job)
-        session.commit()
-        return {"message": "Job deleted"}
+    job = await session.get(ScrapeJob, UUID(job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    await session.delete(job)
+    await session.commit()
+    return {"message": "Job deleted"}
 
 
-@router.post("/jobs/", response_model=ScrapeJobPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
-async def create_job(payload: CreateJobIn) -> ScrapeJobPublic:
-    with Session(engine) as session:
-        job = ScrapeJob.model_validate(payload)
-        session.add(job)
-        session.commit()
-        session.refresh(job)
-        return ScrapeJobPublic.model_validate(job)
+@router.post("/jobs/", response_model=ScrapeJobPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser), Depends(stick_to_primary)])
+async def create_job(session: AsyncSessionDep, payload: CreateJobIn) -> ScrapeJobPublic:
+    job = ScrapeJob.model_validate(payload)
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    return ScrapeJobPublic.model_validate(job)
 
 
-@router.post("/jobs/{job_id}/run", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
-async def run_job(job_id: str) -> dict[str, Any]:
+@router.post("/jobs/{job_id}/run", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser), Depends(stick_to_primary)])
+async def run_job(session: AsyncSessionDep, job_id: str) -> dict[str, Any]:
     from uuid import UUID
 
-    with Session(engine) as session:
-        job = session.get(ScrapeJob, UUID(job_id))
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-        job.status = "running"
-        job.started_at = datetime.utcnow()
-        session.add(job)
-        session.commit()
-        stats = bfs_crawl(session=session, job=job)
-        job.status = "finished"
-        job.finished_at = datetime.utcnow()
-        job.stats = stats
-        session.add(job)
-        session.commit()
-        await _notify_slack(f"[JOB] {job.name} finished: {stats}")
-        if job.webhook_url:
-            try:
-                async with httpx.AsyncClient(timeout=10) as client:
-                    await client.post(job.webhook_url, json={"job_id": str(job.id), "stats": stats})
-            except Exception:
-                pass
-        return {"job_id": str(job.id), "stats": stats}
-
-
-@router.get("/jobs/{job_id}/pages", response_model=CrawlPagesPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
-async def list_job_pages(job_id: str, limit: int = 100, offset: int = 0) -> CrawlPagesPublic:
+    job = await session.get(ScrapeJob, UUID(job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job.status = "running"
+    job.started_at = datetime.utcnow()
+    session.add(job)
+    await session.commit()
+    # The crawler is blocking (sync HTTP and session), so it runs in a worker thread
+    stats = await run_in_threadpool(crawl_job_blocking, job.id)
+    job.status = "finished"
+    job.finished_at = datetime.utcnow()
+    job.stats = stats
+    session.add(job)
+    await session.commit()
+    await _notify_slack(f"[JOB] {job.name} finished: {stats}")
+    if job.webhook_url:
+        try:
+            async with httpx.AsyncClient(timeout=10) as client:
+                await client.post(job.webhook_url, json={"job_id": str(job.id), "stats": stats})
+        except Exception:
+            pass
+    return {"job_id": str(job.id), "stats": stats}
+
+
+def _filter_pages(
+    statement: Any, job_id: uuid.UUID, depth: int | None, status_code: int | None, url: str | None = None
+) -> Any:
+    statement = statement.where(CrawlPage.job_id == job_id)
+    if url:
+        # Fingerprint index lookup; the URL comparison only rules out a collision
+        statement = statement.where(CrawlPage.url_fp == url_fingerprint(url), CrawlPage.url == url)
+    if depth is not None:
+        statement = statement.where(CrawlPage.depth == depth)
+    if status_code is not None:
+        statement = statement.where(CrawlPage.status_code == status_code)
+    return statement
+
+
+def _pages_after(cursor: str) -> Any:
+    depth, fetched_raw, id_raw = decode_cursor(cursor, 3)
+    fetched = cursor_datetime(fetched_raw)
+    if not isinstance(depth, int) or fetched is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple_(CrawlPage.depth, CrawlPage.fetched_at, CrawlPage.id) > tuple_(depth, fetched, cursor_uuid(id_raw))
+
+
+@router.get("/jobs/{job_id}/pages", response_model=CrawlPagesOut, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+async def list_job_pages(
+    session: AsyncReadSessionDep,
+    job_id: str,
+    limit: int = 100,
+    offset: int = 0,
+    depth: int | None = None,
+    status_code: int | None = None,
+    cursor: str | None = None,
+    view: ListView = "full",
+    url: str | None = None,
+) -> CrawlPagesPublic | CrawlPageSummariesPublic:
+    """List a job's pages in crawl order (depth, then fetch time).
+
+    Pass the returned ``next_cursor`` as ``cursor`` for the following page;
+    ``offset`` is still honoured when no cursor is given. ``view=summary`` leaves
+    out ``content_text``/``meta`` (they are not even selected). ``url`` lists the
+    stored versions of one page.
+    """
     from uuid import UUID
 
-    with Session(engine) as session:
-        statement = select(CrawlPage).where(CrawlPage.job_id == UUID(job_id)).offset(offset).limit(limit)
-        pages = session.exec(statement).all()
-        return CrawlPagesPublic(data=[p for p in pages], count=len(pages))
+    statement = _filter_pages(select(CrawlPage), UUID(job_id), depth, status_code, url)
+    if view == "summary":
+        statement = statement.options(_summary_columns(CrawlPage, CrawlPageSummary))
+    count_key = ("crawlpage", job_id, depth, status_code, url)
+    page = statement.order_by(CrawlPage.depth, CrawlPage.fetched_at, CrawlPage.id)
+    if cursor:
+        page = page.where(_pages_after(cursor))
+        pages = (await session.exec(page.limit(limit))).all()
+        count = await filtered_count(session, statement, count_key)
+    else:
+        pages, count = await page_with_total(session, page, count_key, limit=limit, offset=offset)
+    next_cursor = None
+    if pages and len(pages) == limit:
+        last = pages[-1]
+        next_cursor = encode_cursor(last.depth, last.fetched_at, last.id)
+    if view == "summary":
+        return CrawlPageSummariesPublic(
+            data=[CrawlPageSummary.model_validate(p) for p in pages], count=count, next_cursor=next_cursor
+        )
+    return CrawlPagesPublic(data=[p for p in pages], count=count, next_cursor=next_cursor)
+
+
+@router.get("/jobs/{job_id}/pages/top", response_model=CrawlPageSummariesPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+async def list_top_job_pages(
+    session: AsyncReadSessionDep,
+    job_id: uuid.UUID,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> Response:
+    """A job's most important pages by link-graph PageRank from its latest crawl
+    (``score``; 1.0 is the average page)."""
+    statement = (
+        select(*_schema_columns(CrawlPage, CrawlPageSummary))
+        .where(CrawlPage.job_id == job_id, CrawlPage.node_id.is_not(None))  # type: ignore[union-attr]
+        .order_by(CrawlPage.score.desc().nulls_last(), CrawlPage.id)  # type: ignore[union-attr]
+        .limit(limit)
+    )
+    items = row_dicts(await session.execute(statement))
+    return json_response(CrawlPageSummariesPublic, {"data": items, "count": len(items)})
+
+
+@router.get("/jobs/{job_id}/runs", response_model=CrawlRunsPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+async def list_job_runs(session: AsyncReadSessionDep, job_id: uuid.UUID) -> Response:
+    """A job's crawl runs, latest first, with their new/changed/removed/unchanged counts."""
+    statement = (
+        select(*_schema_columns(CrawlRun, CrawlRunPublic))
+        .where(CrawlRun.job_id == job_id)
+        .order_by(CrawlRun.number.desc())  # type: ignore[attr-defined]
+    )
+    items = row_dicts(await session.execute(statement))
+    return json_response(CrawlRunsPublic, {"data": items, "count": len(items)})
+
+
+@router.get("/jobs/{job_id}/changes", response_model=CrawlChangesPublic, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+async def list_job_changes(
+    session: AsyncReadSessionDep,
+    job_id: uuid.UUID,
+    since: int = Query(default=0, ge=0, description="Run number; 0 lists everything found so far"),
+) -> Response:
+    """Pages that are new, changed or removed in the job's finished runs after run
+    ``since``, netted per URL (``page_id`` is the latest version, or the last one
+    seen for removed pages). Only change records are read, so the cost follows the
+    churn rather than the size of the site."""
+    runs = (
+        await session.exec(
+            select(CrawlRun.id, CrawlRun.number).where(
+                CrawlRun.job_id == job_id,
+                CrawlRun.number > since,
+                CrawlRun.finished_at.is_not(None),  # type: ignore[union-attr]
+            )
+        )
+    ).all()
+    latest = max((number for _, number in runs), default=None)
+    if not runs:
+        return json_response(CrawlChangesPublic, {"since": since, "latest": latest, "data": [], "count": 0})
+    records = await session.exec(
+        select(CrawlChange.url_fp, CrawlRun.number, CrawlChange.kind, CrawlChange.page_id)
+        .join(CrawlRun, CrawlRun.id == CrawlChange.run_id)  # type: ignore[arg-type]
+        .where(CrawlChange.run_id.in_([run_id for run_id, _ in runs]), CrawlChange.kind != UNCHANGED)  # type: ignore[attr-defined]
+        .order_by(CrawlRun.number)
+    )
+    changes = net_changes(records.all())
+    page_ids = [c["page_id"] for c in changes]
+    pages = {
+        row.id: row
+        for row in await session.execute(
+            select(CrawlPage.id, CrawlPage.url, CrawlPage.title).where(CrawlPage.id.in_(page_ids))  # type: ignore[attr-defined]
+        )
+    }
+    data = [{**c, "url": pages[c["page_id"]].url, "title": pages[c["page_id"]].title} for c in changes if c["page_id"] in pages]
+    data.sort(key=lambda c: c["url"])
+    return json_response(CrawlChangesPublic, {"since": since, "latest": latest, "data": data, "count": len(data)})
 
 
 @router.post(
     "/run/",
-    dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)],
+    dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser), Depends(stick_to_primary)],
     status_code=201,
 )
 async def run_scraper(companies: list[str] = Query(default=[])) -> dict[str, Any]:
     if not companies:
         raise HTTPException(status_code=400, detail="Provide at least one company name")
 
-    results: dict[str, Any] = {}
-    inserted_total = 0
-    with Session(engine) as session:
-        for company in companies:
-            summary = run_scraping_for_company(session=session, company=company)
-            results[company] = summary
-            inserted_total += int(summary.get("inserted", 0))
+    results = await run_in_threadpool(run_scraping_blocking, companies)
+    inserted_total = sum(int(summary.get("inserted", 0)) for summary in results.values())
     await _notify_slack(f"Scraper run completed for {', '.join(companies)}: {inserted_total} new/updated items")
     return {"results": results}
 
 
 @router.post("/run-cron/", status_code=201)
-async def run_scraper_cron(request: Request, companies: list[str] = Query(default=[]), token: str | None = None) -> dict[str, Any]:
+async def run_scraper_cron(
+    request: Request,
+    companies: list[str] = Query(default=[]),
+    token: str | None = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Poll companies whose adaptive schedule is due; ``force`` polls all of them."""
     auth_token = token or request.headers.get("X-Cron-Token")
     if not settings.SCRAPER_CRON_TOKEN or auth_token != settings.SCRAPER_CRON_TOKEN:
         raise HTTPException(status_code=403, detail="Invalid cron token")
     if not companies:
-        companies = ["laudite", "laudos.ai", "laudos", "leorad"]
-    results: dict[str, Any] = {}
-    inserted_total = 0
-    with Session(engine) as session:
-        for company in companies:
-            summary = run_scraping_for_company(session=session, company=company)
-            results[company] = summary
-            inserted_total += int(summary.get("inserted", 0))
-    await _notify_slack(f"[CRON] Scraper run completed for {', '.join(companies)}: {inserted_total} items")
-    return {"results": results, "scheduled": True}
-
-
-@router.get("/posts/", response_model=ScrapedPostsPublic)
+        companies = await run_in_threadpool(sources.enabled_companies)
+    results = await run_in_threadpool(run_scraping_blocking, companies, due_only=not force)
+    skipped = [c for c in companies if c not in results]
+    if results:
+        inserted_total = sum(int(summary.get("inserted", 0)) for summary in results.values())
+        await _notify_slack(f"[CRON] Scraper run completed for {', '.join(results)}: {inserted_total} items")
+    return {"results": results, "skipped": skipped, "scheduled": True}
+
+
+@router.post("/rescore/", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+async def rescore(company: str | None = None) -> dict[str, int]:
+    """Recompute stored post scores now, for all posts or one company's (they are
+    otherwise refreshed periodically)."""
+    return await run_in_threadpool(rescore_blocking, company)
+
+
+# Feed order for posts. Undated posts sort last via -infinity so the whole key is
+# non-null and keyset comparisons can use the composite indexes from 6b3f9d27c001.
+POST_SORT_PUBLISHED = func.coalesce(ScrapedPost.published_at, literal_column("'-infinity'::timestamptz"))
+
+
+def _filter_posts(
+    statement: Any, company: str | None, platform: str | None, newer_than: datetime | None, collapse: bool = False
+) -> Any:
+    if collapse:
+        # Near-duplicates point at their original (see find_near_duplicate_post)
+        statement = statement.where(ScrapedPost.duplicate_of.is_(None))  # type: ignore[union-attr]
+    if company:
+        statement = statement.where(ScrapedPost.company == company)
+    if platform:
+        statement = statement.where(ScrapedPost.platform == platform)
+    if newer_than:
+        statement = statement.where(ScrapedPost.published_at >= newer_than)
+    return statement
+
+
+def _posts_after(cursor: str) -> Any:
+    published_raw, fetched_raw, id_raw = decode_cursor(cursor, 3)
+    published = cursor_datetime(published_raw)
+    fetched = cursor_datetime(fetched_raw)
+    if fetched is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple_(POST_SORT_PUBLISHED, ScrapedPost.fetched_at, ScrapedPost.id) < tuple_(
+        published if published is not None else literal_column("'-infinity'::timestamptz"),
+        fetched,
+        cursor_uuid(id_raw),
+    )
+
+
+# (ETag, JSON body) of listing pages, keyed by normalized parameters and the posts generation
+posts_cache: TTLCache[tuple[str, bytes]] = TTLCache(maxsize=settings.POSTS_CACHE_MAXSIZE, ttl=settings.POSTS_CACHE_TTL_SECONDS)
+
+
+async def _render_posts(
+    session: AsyncSession,
+    *,
+    company: str | None,
+    platform: str | None,
+    limit: int,
+    offset: int,
+    newer_than: datetime | None,
+    cursor: str | None,
+    view: ListView,
+    collapse: bool,
+) -> bytes:
+    """One listing page as JSON bytes, built from plain rows (no ORM objects)."""
+    out_model = ScrapedPostSummariesPublic if view == "summary" else ScrapedPostsPublic
+    schema = ScrapedPostSummary if view == "summary" else ScrapedPostPublic
+    statement = _filter_posts(select(*_schema_columns(ScrapedPost, schema)), company, platform, newer_than, collapse)
+    filtered = bool(company or platform or newer_than or collapse)
+    count_key = ("scrapedpost", company, platform, newer_than.isoformat() if newer_than else None, collapse)
+    page = statement.order_by(
+        POST_SORT_PUBLISHED.desc(), ScrapedPost.fetched_at.desc(), ScrapedPost.id.desc()
+    )
+    if cursor:
+        page = page.where(_posts_after(cursor))
+    if filtered and not cursor:
+        items, count = await page_with_total(session, page, count_key, limit=limit, offset=offset)
+    else:
+        items = row_dicts(await session.execute(page.offset(0 if cursor else offset).limit(limit)))
+        if filtered:
+            count = await filtered_count(session, statement, count_key)
+        else:
+            count = await table_count(session, ScrapedPost)
+    next_cursor = None
+    if items and len(items) == limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["published_at"], last["fetched_at"], last["id"])
+    return dump_json(out_model, {"data": items, "count": count, "next_cursor": next_cursor})
+
+
+@router.get("/posts/", response_model=ScrapedPostsOut)
 async def list_posts(
+    request: Request,
+    session: AsyncReadSessionDep,
     company: str | None = None,
     platform: str | None = None,
     limit: int = 50,
     offset: int = 0,
     newer_than: datetime | None = None,
-) -> ScrapedPostsPublic:
-    with Session(engine) as session:
-        statement = select(ScrapedPost)
-        if company:
-            statement = statement.where(ScrapedPost.company == company)
-        if platform:
-            statement = statement.where(ScrapedPost.platform == platform)
-        if newer_than:
-            statement = statement.where(ScrapedPost.published_at >= newer_than)
-        statement = statement.order_by(ScrapedPost.published_at.desc(), ScrapedPost.fetched_at.desc())
-        items = session.exec(statement.offset(offset).limit(limit)).all()
-        count = len(items)
-        data = [ScrapedPostPublic.model_validate(i) for i in items]
-        return ScrapedPostsPublic(data=data, count=count)
+    cursor: str | None = None,
+    view: ListView = "full",
+    collapse: bool = False,
+) -> Response:
+    """List posts, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to get the following page at
+    constant cost; ``offset`` is still honoured when no cursor is given. ``count`` is
+    the total matching the filters (estimated for the unfiltered listing of a large
+    table). ``view=summary`` leaves out ``content``/``metadata`` (they are not even
+    selected). ``collapse=true`` drops near-duplicates of earlier posts (the same
+    article under another URL), keeping the first one seen.
+
+    Responses are cached as JSON bytes until the TTL runs out or posts change, and
+    carry an ETag (hash of the body); a matching ``If-None-Match`` gets a 304.
+    """
+    key = (
+        posts_generation.value,
+        company,
+        platform,
+        limit,
+        offset,
+        newer_than.isoformat() if newer_than else None,
+        cursor,
+        view,
+        collapse,
+    )
+    cached = posts_cache.get(key)
+    if cached is None:
+        body = await _render_posts(
+            session,
+            company=company,
+            platform=platform,
+            limit=limit,
+            offset=offset,
+            newer_than=newer_than,
+            cursor=cursor,
+            view=view,
+            collapse=collapse,
+        )
+        cached = (body_etag(body), body)
+        posts_cache.set(key, cached)
+    etag, body = cached
+    unchanged = not_modified(request, etag, settings.CACHE_CONTROL_POSTS)
+    if unchanged is not None:
+        return unchanged
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag, settings.CACHE_CONTROL_POSTS))
+
+
+@router.get("/posts/top", response_model=TopPostsPublic)
+async def list_top_posts(
+    session: AsyncReadSessionDep,
+    company: str | None = None,
+    platform: str | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+) -> Response:
+    """Best posts by current score (recency decay and length times source weight).
+
+    Scores are computed in the query as of now, unlike the stored ``score`` which
+    is only refreshed periodically.
+    """
+    scored_at = datetime.now(timezone.utc)
+    weights = await run_in_threadpool(sources.weights)
+    items = await top_posts(session, weights, company=company, platform=platform, limit=limit, now=scored_at)
+    return json_response(TopPostsPublic, {"data": items, "scored_at": scored_at})
+
+
+@router.get("/posts/search", response_model=SearchResults)
+async def search_posts_route(
+    session: AsyncReadSessionDep,
+    q: str = Query(min_length=1, max_length=512),
+    language: str | None = None,
+    company: str | None = None,
+    platform: str | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+) -> SearchResults:
+    """Full-text search over post titles and content, best matches first.
+
+    ``q`` uses web search syntax ("quoted phrases", OR, -exclusions); ``language``
+    selects the stemming configuration used to parse it.
+    """
+    hits, next_cursor = await search_posts(
+        session, q, language=language, company=company, platform=platform, limit=limit, cursor=cursor
+    )
+    return SearchResults(data=hits, next_cursor=next_cursor)
+
+
+@router.get("/pages/search", response_model=SearchResults, dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+async def search_pages_route(
+    session: AsyncReadSessionDep,
+    q: str = Query(min_length=1, max_length=512),
+    job_id: uuid.UUID | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+) -> SearchResults:
+    """Full-text search over crawled page titles and text, optionally within one job."""
+    hits, next_cursor = await search_pages(session, q, job_id=job_id, limit=limit, cursor=cursor)
+    return SearchResults(data=hits, next_cursor=next_cursor)
+
+
+@router.get("/posts/export", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+def export_posts(
+    request: Request,
+    format: ExportFormat = "ndjson",
+    company: str | None = None,
+    platform: str | None = None,
+    newer_than: datetime | None = None,
+) -> StreamingResponse:
+    """Stream matching posts as NDJSON or CSV with constant memory."""
+    statement = _filter_posts(select(*ScrapedPost.__table__.columns), company, platform, newer_than)  # type: ignore[attr-defined]
+    statement = statement.order_by(POST_SORT_PUBLISHED.desc(), ScrapedPost.fetched_at.desc(), ScrapedPost.id.desc())
+    return export_response(request, statement, format=format, filename="posts")
+
+
+@router.get("/jobs/{job_id}/pages/export", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+def export_job_pages(
+    request: Request,
+    job_id: uuid.UUID,
+    format: ExportFormat = "ndjson",
+    depth: int | None = None,
+    status_code: int | None = None,
+) -> StreamingResponse:
+    """Stream a job's pages in crawl order as NDJSON or CSV with constant memory."""
+    statement = _filter_pages(select(*CrawlPage.__table__.columns), job_id, depth, status_code)  # type: ignore[attr-defined]
+    statement = statement.order_by(CrawlPage.depth, CrawlPage.fetched_at, CrawlPage.id)
+    return export_response(request, statement, format=format, filename=f"job-{job_id}-pages")
+
+
+def _parquet_download(request: Request, statement: Any, filename: str) -> FileResponse:
+    try:
+        return parquet_response(statement, filename=filename, bind=read_bind(request))
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+
+@router.get("/posts/export.parquet", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+def export_posts_parquet(
+    request: Request,
+    company: str | None = None,
+    platform: str | None = None,
+    newer_than: datetime | None = None,
+) -> FileResponse:
+    """Download matching posts as a Parquet file (columnar, for pandas/Arrow)."""
+    statement = _filter_posts(select(*ScrapedPost.__table__.columns), company, platform, newer_than)  # type: ignore[attr-defined]
+    return _parquet_download(request, statement, "posts")
+
+
+@router.get("/jobs/{job_id}/pages/export.parquet", dependencies=[Depends(require_ip_allowlist), Depends(require_api_key), Depends(get_current_active_superuser)])
+def export_job_pages_parquet(
+    request: Request,
+    job_id: uuid.UUID,
+    depth: int | None = None,
+    status_code: int | None = None,
+) -> FileResponse:
+    """Download a job's pages as a Parquet file (columnar, for pandas/Arrow)."""
+    statement = _filter_pages(select(*CrawlPage.__table__.columns), job_id, depth, status_code)  # type: ignore[attr-defined]
+    statement = statement.order_by(CrawlPage.depth, CrawlPage.fetched_at, CrawlPage.id)
+    return _parquet_download(request, statement, f"job-{job_id}-pages")
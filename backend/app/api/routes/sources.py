@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import (
+    AsyncSessionDep,
+    get_current_active_superuser,
+    require_api_key,
+    require_ip_allowlist,
+    stick_to_primary,
+)
+from app.models import (
+    Message,
+    Source,
+    SourceCreate,
+    SourcePublic,
+    SourcesPublic,
+    SourceUpdate,
+)
+from app.scraper.rescore import rescore_blocking
+from app.scraper.scoring import DEFAULT_SOURCE_WEIGHT
+from app.scraper.sources import sources
+
+router = APIRouter(prefix="/sources", tags=["sources"])
+
+
+async def _get_source(session: AsyncSession, company: str) -> Source:
+    source = (
+        await session.exec(select(Source).where(Source.company == company))
+    ).first()
+    if not source:
+        raise HTTPException(status_code=404, detail="Source not found")
+    return source
+
+
+@router.get(
+    "/",
+    response_model=SourcesPublic,
+    dependencies=[
+        Depends(require_ip_allowlist),
+        Depends(require_api_key),
+        Depends(get_current_active_superuser),
+    ],
+)
+async def list_sources(session: AsyncSessionDep) -> Any:
+    items = (await session.exec(select(Source).order_by(Source.company))).all()
+    count = (await session.exec(select(func.count()).select_from(Source))).one()
+    return SourcesPublic(
+        data=[SourcePublic.model_validate(s) for s in items], count=count
+    )
+
+
+@router.post(
+    "/",
+    response_model=SourcePublic,
+    dependencies=[
+        Depends(require_ip_allowlist),
+        Depends(require_api_key),
+        Depends(get_current_active_superuser),
+        Depends(stick_to_primary),
+    ],
+)
+async def create_source(
+    session: AsyncSessionDep, background_tasks: BackgroundTasks, payload: SourceCreate
+) -> Any:
+    """Add a source; it is scraped from the next scheduled run on."""
+    if (
+        await session.exec(select(Source.id).where(Source.company == payload.company))
+    ).first():
+        raise HTTPException(status_code=409, detail="Source already exists")
+    source = Source.model_validate(payload)
+    session.add(source)
+    await session.commit()
+    await session.refresh(source)
+    sources.invalidate()
+    if source.weight != DEFAULT_SOURCE_WEIGHT:
+        # Posts stored before the source existed were scored with the default weight
+        background_tasks.add_task(rescore_blocking, source.company)
+    return SourcePublic.model_validate(source)
+
+
+@router.patch(
+    "/{company}",
+    response_model=SourcePublic,
+    dependencies=[
+        Depends(require_ip_allowlist),
+        Depends(require_api_key),
+        Depends(get_current_active_superuser),
+        Depends(stick_to_primary),
+    ],
+)
+async def update_source(
+    session: AsyncSessionDep,
+    background_tasks: BackgroundTasks,
+    company: str,
+    payload: SourceUpdate,
+) -> Any:
+    """Update a source. A weight change rescores that source's posts in the background."""
+    source = await _get_source(session, company)
+    previous_weight = source.weight
+    source.sqlmodel_update(
+        payload.model_dump(exclude_unset=True),
+        update={"updated_at": datetime.now(timezone.utc)},
+    )
+    session.add(source)
+    await session.commit()
+    await session.refresh(source)
+    sources.invalidate()
+    if source.weight != previous_weight:
+        background_tasks.add_task(rescore_blocking, source.company)
+    return SourcePublic.model_validate(source)
+
+
+@router.delete(
+    "/{company}",
+    response_model=Message,
+    dependencies=[
+        Depends(require_ip_allowlist),
+        Depends(require_api_key),
+        Depends(get_current_active_superuser),
+        Depends(stick_to_primary),
+    ],
+)
+async def delete_source(
+    session: AsyncSessionDep, background_tasks: BackgroundTasks, company: str
+) -> Message:
+    """Remove a source. Its stored posts are kept and fall back to the default weight."""
+    source = await _get_source(session, company)
+    weight = source.weight
+    await session.delete(source)
+    await session.commit()
+    sources.invalidate()
+    if weight != DEFAULT_SOURCE_WEIGHT:
+        background_tasks.add_task(rescore_blocking, company)
+    return Message(message="Source deleted")
@@ -1,7 +1,11 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.db import async_engine, async_read_engine, engine, read_engine
+from app.core.pool import pool_stats
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -29,3 +33,15 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get("/db-pool/", dependencies=[Depends(get_current_active_superuser)])
+def db_pool_stats() -> dict[str, Any]:
+    """
+    Connection pool occupancy and checkout wait times, per engine.
+    """
+    stats = {"sync": pool_stats(engine.pool), "async": pool_stats(async_engine.pool)}
+    if read_engine is not engine:
+        stats["replica_sync"] = pool_stats(read_engine.pool)
+        stats["replica_async"] = pool_stats(async_read_engine.pool)
+    return stats
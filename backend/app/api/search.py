@@ -0,0 +1,149 @@
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import Float, Uuid, cast, literal, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import col, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.pagination import cursor_uuid, decode_cursor, encode_cursor
+from app.models import CrawlPage, ScrapedPost, SearchHit
+
+# Text search configurations by ISO 639-1 prefix of the ``language`` column. Keep in
+# sync with the CASE expression in migration 7d4c1e58c001.
+TS_CONFIGS = {
+    "pt": "portuguese",
+    "en": "english",
+    "es": "spanish",
+    "fr": "french",
+    "de": "german",
+    "it": "italian",
+}
+
+HEADLINE_OPTIONS = (
+    "MaxFragments=2, MaxWords=30, MinWords=10, StartSel=<mark>, StopSel=</mark>"
+)
+
+# Generated columns from the migration; deliberately not mapped on the models so
+# regular ORM loads don't fetch them.
+POST_VECTOR = literal_column("scrapedpost.search_vector", type_=TSVECTOR)
+PAGE_VECTOR = literal_column("crawlpage.search_vector", type_=TSVECTOR)
+
+
+def ts_config(language: str | None) -> str:
+    if not language:
+        return "simple"
+    return TS_CONFIGS.get(language[:2].lower(), "simple")
+
+
+def _regconfig(config: str) -> Any:
+    # ``config`` only ever comes from TS_CONFIGS, so inlining it is safe
+    return literal_column(f"'{config}'::regconfig")
+
+
+def _rank(vector: Any, query: Any) -> Any:
+    # ts_rank returns a REAL; ranked, ordered and compared as double precision so the
+    # value a cursor carries (a Python float) matches the column exactly
+    return cast(func.ts_rank(vector, query), Float(53))
+
+
+def _after(rank: Any, id_column: Any, cursor: str | None) -> Any:
+    if not cursor:
+        return None
+    rank_raw, id_raw = decode_cursor(cursor, 2)
+    if not isinstance(rank_raw, int | float):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple_(rank, id_column) < tuple_(
+        literal(float(rank_raw), Float(53)), literal(cursor_uuid(id_raw), Uuid)
+    )
+
+
+async def _hits(
+    session: AsyncSession, ranked: Any, text_column: str, config: str, query: Any
+) -> list[SearchHit]:
+    """Run the ranked page subquery and add highlighted snippets for just those rows."""
+    page = ranked.subquery()
+    headline = func.ts_headline(
+        _regconfig(config),
+        func.coalesce(page.c[text_column], page.c.title, ""),
+        query,
+        HEADLINE_OPTIONS,
+    )
+    columns = [c for c in page.c if c.name != text_column]
+    statement = select(*columns, headline.label("snippet")).order_by(
+        page.c.rank.desc(), page.c.id.desc()
+    )
+    return [
+        SearchHit.model_validate(dict(row._mapping))
+        for row in await session.execute(statement)
+    ]
+
+
+def _next_cursor(hits: list[SearchHit], limit: int) -> str | None:
+    if len(hits) < limit:
+        return None
+    return encode_cursor(hits[-1].rank, hits[-1].id)
+
+
+async def search_posts(
+    session: AsyncSession,
+    q: str,
+    *,
+    language: str | None = None,
+    company: str | None = None,
+    platform: str | None = None,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> tuple[list[SearchHit], str | None]:
+    config = ts_config(language)
+    query = func.websearch_to_tsquery(_regconfig(config), q)
+    rank = _rank(POST_VECTOR, query)
+    ranked = select(
+        col(ScrapedPost.id),
+        col(ScrapedPost.url),
+        col(ScrapedPost.title),
+        col(ScrapedPost.content),
+        col(ScrapedPost.company),
+        col(ScrapedPost.platform),
+        col(ScrapedPost.published_at),
+        rank.label("rank"),
+    ).where(POST_VECTOR.op("@@")(query))
+    if company:
+        ranked = ranked.where(col(ScrapedPost.company) == company)
+    if platform:
+        ranked = ranked.where(col(ScrapedPost.platform) == platform)
+    after = _after(rank, ScrapedPost.id, cursor)
+    if after is not None:
+        ranked = ranked.where(after)
+    ranked = ranked.order_by(rank.desc(), col(ScrapedPost.id).desc()).limit(limit)
+    hits = await _hits(session, ranked, "content", config, query)
+    return hits, _next_cursor(hits, limit)
+
+
+async def search_pages(
+    session: AsyncSession,
+    q: str,
+    *,
+    job_id: Any = None,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> tuple[list[SearchHit], str | None]:
+    # Pages have no language column and are indexed with the "simple" config
+    query = func.websearch_to_tsquery(_regconfig("simple"), q)
+    rank = _rank(PAGE_VECTOR, query)
+    ranked = select(
+        col(CrawlPage.id),
+        col(CrawlPage.url),
+        col(CrawlPage.title),
+        col(CrawlPage.content_text),
+        col(CrawlPage.job_id),
+        rank.label("rank"),
+    ).where(PAGE_VECTOR.op("@@")(query))
+    if job_id is not None:
+        ranked = ranked.where(col(CrawlPage.job_id) == job_id)
+    after = _after(rank, CrawlPage.id, cursor)
+    if after is not None:
+        ranked = ranked.where(after)
+    ranked = ranked.order_by(rank.desc(), col(CrawlPage.id).desc()).limit(limit)
+    hits = await _hits(session, ranked, "content_text", "simple", query)
+    return hits, _next_cursor(hits, limit)
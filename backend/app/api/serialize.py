@@ -0,0 +1,38 @@
+import functools
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+
+
+@functools.cache
+def adapter(model: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(model)
+
+
+def row_dicts(rows: Iterable[Row[Any]]) -> list[dict[str, Any]]:
+    """Plain column-name dicts from rows of a column (not entity) select."""
+    return [row._asdict() for row in rows]
+
+
+def dump_json(model: Any, payload: dict[str, Any]) -> bytes:
+    """Validate a whole response payload built from plain dicts in one pass and
+    encode it to JSON bytes.
+
+    Validation and encoding both run in pydantic-core, once for the whole page,
+    instead of once per ORM row plus again for the response model.
+    """
+    model_adapter = adapter(model)
+    return model_adapter.dump_json(model_adapter.validate_python(payload))
+
+
+def json_response(
+    model: Any, payload: dict[str, Any], headers: dict[str, str] | None = None
+) -> Response:
+    return Response(
+        content=dump_json(model, payload),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -61,6 +61,22 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = "app"
     DATABASE_URL: PydPostgresDsn | None = None
+    # Connection pool, per engine. A process has a sync and an async engine for the
+    # primary (plus one of each for DATABASE_REPLICA_URL), so it may open up to
+    # 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections to each database: 30 by default.
+    # Multiply by workers/replicas and keep it under the server's max_connections.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = (
+        1800  # seconds; replaces connections before server/proxy idle cutoffs
+    )
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: bool = True  # open DB_POOL_SIZE connections per engine at startup
+    # Optional read replica for read-only endpoints and exports; writes always use the primary
+    DATABASE_REPLICA_URL: PydPostgresDsn | None = None
+    # After a write, the same client reads from the primary this long (read-your-writes)
+    DATABASE_REPLICA_STICKY_SECONDS: int = 10
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -126,6 +142,18 @@ class Settings(BaseSettings):
     # Integrations / Scraper options
     SLACK_WEBHOOK_URL: HttpUrl | None = None
     SCRAPER_CRON_TOKEN: str | None = None
+    # How long discovered feed URLs (and dead candidates) are trusted before rediscovery
+    SCRAPER_DISCOVERY_TTL_HOURS: int = 24 * 7
+    # Adaptive polling: run the in-process scheduler and bound each source's poll interval
+    SCRAPER_SCHEDULER_ENABLED: bool = False
+    SCRAPER_POLL_MIN_MINUTES: int = 15
+    SCRAPER_POLL_MAX_HOURS: int = 24
+    SCRAPER_POLL_JITTER: float = 0.1
+    # Stored post scores decay with age; a background task rescores all posts this often
+    SCRAPER_RESCORE_ENABLED: bool = False
+    SCRAPER_RESCORE_INTERVAL_HOURS: float = 6
+    # Sources are cached in-process; edits in another process show up after this long
+    SOURCES_CACHE_TTL_SECONDS: int = 60
 
     # API hardening
     API_KEY: str | None = None
@@ -134,5 +162,21 @@ class Settings(BaseSettings):
     # Optional external render service (e.g., Rendertron/Prerender) base URL
     RENDER_SERVICE_URL: HttpUrl | None = None
 
+    # Listing totals: cache lifetime, and table size above which unfiltered totals are estimated
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_ESTIMATE_THRESHOLD: int = 100_000
+    # Serialized GET /scraper/posts/ responses; post writes in this process invalidate them at once
+    POSTS_CACHE_TTL_SECONDS: int = 60
+    POSTS_CACHE_MAXSIZE: int = 512
+    # Cache-Control sent with ETagged responses; "no-cache" means clients revalidate
+    # (If-None-Match -> 304) on every use instead of trusting a stale copy
+    CACHE_CONTROL_POSTS: str = "public, no-cache"
+    CACHE_CONTROL_JOB: str = "private, no-cache"
+    CACHE_CONTROL_ITEMS: str = "private, no-cache"
+
+    # Crawl frontier: URLs/fingerprints kept in memory before spilling to disk
+    CRAWL_FRONTIER_MEMORY_ITEMS: int = 100_000
+    CRAWL_FRONTIER_SPILL_DIR: str | None = None  # defaults to the system temp dir
+
 
 settings = Settings()  # type: ignore
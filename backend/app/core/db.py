@@ -1,10 +1,49 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine, select
 
 from app import crud
 from app.core.config import settings
+from app.core.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedQueuePool,
+    **POOL_OPTIONS,
+)
+# Same database for the async routes; "postgresql+psycopg" resolves to psycopg's async
+# dialect here. Scripts, migrations and tests keep using the sync ``engine``.
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedAsyncQueuePool,
+    **POOL_OPTIONS,
+)
+
+# Read-only traffic goes to the replica when one is configured, else to the primary
+if settings.DATABASE_REPLICA_URL:
+    read_engine = create_engine(
+        str(settings.DATABASE_REPLICA_URL),
+        poolclass=InstrumentedQueuePool,
+        **POOL_OPTIONS,
+    )
+    async_read_engine = create_async_engine(
+        str(settings.DATABASE_REPLICA_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        **POOL_OPTIONS,
+    )
+else:
+    read_engine = engine
+    async_read_engine = async_engine
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
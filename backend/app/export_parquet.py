@@ -0,0 +1,38 @@
+import argparse
+import logging
+import uuid
+
+from sqlmodel import select
+
+from app.api.export import write_parquet
+from app.models import CrawlPage, ScrapedPost
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export crawl results to Parquet")
+    parser.add_argument("output", help="Path of the .parquet file to write")
+    parser.add_argument(
+        "--job-id", type=uuid.UUID, help="Export this job's crawl pages"
+    )
+    parser.add_argument("--company", help="Export scraped posts of this company")
+    args = parser.parse_args()
+
+    if args.job_id:
+        statement = (
+            select(*CrawlPage.__table__.columns)  # type: ignore[attr-defined]
+            .where(CrawlPage.job_id == args.job_id)
+            .order_by(CrawlPage.depth, CrawlPage.fetched_at, CrawlPage.id)
+        )
+    else:
+        statement = select(*ScrapedPost.__table__.columns)  # type: ignore[attr-defined]
+        if args.company:
+            statement = statement.where(ScrapedPost.company == args.company)
+    rows = write_parquet(statement, args.output)
+    logger.info("Wrote %d rows to %s", rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
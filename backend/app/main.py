@@ -1,3 +1,8 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
@@ -5,6 +10,12 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.db import async_engine, async_read_engine, engine, read_engine
+from app.core.pool import warm_up, warm_up_async
+from app.scraper.rescore import rescore_periodically
+from app.scraper.scheduler import PollScheduler
+
+logger = logging.getLogger(__name__)
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -14,10 +25,43 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    if settings.DB_POOL_WARMUP:
+        # Connect up front so the first requests after a deploy don't pay for it
+        warmups = [
+            asyncio.to_thread(warm_up, engine, settings.DB_POOL_SIZE),
+            warm_up_async(async_engine, settings.DB_POOL_SIZE),
+        ]
+        if read_engine is not engine:
+            warmups.append(
+                asyncio.to_thread(warm_up, read_engine, settings.DB_POOL_SIZE)
+            )
+            warmups.append(warm_up_async(async_read_engine, settings.DB_POOL_SIZE))
+        try:
+            await asyncio.gather(*warmups)
+        except Exception:
+            logger.warning("Database pool warm-up failed", exc_info=True)
+    scheduler = PollScheduler()
+    rescoring: asyncio.Task[None] | None = None
+    if settings.SCRAPER_SCHEDULER_ENABLED:
+        scheduler.start()
+    if settings.SCRAPER_RESCORE_ENABLED:
+        rescoring = asyncio.create_task(
+            rescore_periodically(settings.SCRAPER_RESCORE_INTERVAL_HOURS * 3600)
+        )
+    yield
+    await scheduler.stop()
+    if rescoring is not None:
+        rescoring.cancel()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins
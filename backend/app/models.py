@@ -3,12 +3,20 @@ import uuid
 from pydantic import EmailStr
 from sqlmodel import Field, Relationship, SQLModel
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Literal
 
-from sqlalchemy import Column
+from sqlalchemy import BigInteger, Column, Computed, Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 
 
+# Signed 64-bit URL fingerprint, as computed by app.scraper.frontier.url_fingerprint.
+# URL lookups go through indexes on these columns and compare the full URL only to
+# rule out a collision.
+URL_FP_SQL = "('x' || substr(md5({}), 1, 16))::bit(64)::bigint"
+# Digest of a post's title and content; must match app.scraper.utils.content_fingerprint
+CONTENT_FP_SQL = "md5(coalesce(title, '') || coalesce(content, ''))"
+
+
 # Shared properties
 class UserBase(SQLModel):
     email: EmailStr = Field(unique=True, index=True, max_length=255)
@@ -122,7 +130,7 @@ class NewPassword(SQLModel):
 class ScrapedPostBase(SQLModel):
     company: str = Field(index=True, max_length=128)
     platform: str = Field(index=True, max_length=64)
-    url: str = Field(unique=True, max_length=2048)
+    url: str = Field(max_length=2048)
     title: str | None = Field(default=None, max_length=1024)
     content: str | None = None
     language: str | None = Field(default=None, max_length=12)
@@ -136,6 +144,23 @@ class ScrapedPostBase(SQLModel):
 
 class ScrapedPost(ScrapedPostBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    url_fp: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            Computed(URL_FP_SQL.format("url"), persisted=True),
+            unique=True,
+            index=True,
+        ),
+    )
+    # Lets feed parsing skip entries stored unchanged without hashing the archive
+    content_fp: str | None = Field(
+        default=None,
+        sa_column=Column(String(32), Computed(CONTENT_FP_SQL, persisted=True)),
+    )
+    # SimHash of title and content; near-duplicates point at the first post seen
+    simhash: int | None = Field(default=None, sa_column=Column(BigInteger))
+    duplicate_of: uuid.UUID | None = None
 
 
 class ScrapedPostPublic(ScrapedPostBase):
@@ -143,8 +168,36 @@ class ScrapedPostPublic(ScrapedPostBase):
 
 
 class ScrapedPostsPublic(SQLModel):
+    view: Literal["full"] = "full"
     data: list[ScrapedPostPublic]
     count: int
+    next_cursor: str | None = None
+
+
+# Listing projection without the heavy text/JSON columns (view=summary)
+class ScrapedPostSummary(SQLModel):
+    id: uuid.UUID
+    company: str
+    platform: str
+    url: str
+    title: str | None = None
+    language: str | None = None
+    published_at: datetime | None = None
+    fetched_at: datetime
+    score: float | None = None
+
+
+class ScrapedPostSummariesPublic(SQLModel):
+    view: Literal["summary"] = "summary"
+    data: list[ScrapedPostSummary]
+    count: int
+    next_cursor: str | None = None
+
+
+# Posts ranked by their score as of ``scored_at`` (computed at query time)
+class TopPostsPublic(SQLModel):
+    data: list[ScrapedPostSummary]
+    scored_at: datetime
 
 
 # Crawl job models (Firecrawl-style)
@@ -175,8 +228,8 @@ class ScrapeJobPublic(ScrapeJobBase):
 
 class CrawlPageBase(SQLModel):
     job_id: uuid.UUID
-    url: str = Field(max_length=2048, index=True)
-    normalized_url: str = Field(max_length=2048, index=True)
+    url: str = Field(max_length=2048)
+    normalized_url: str = Field(max_length=2048)
     depth: int = 0
     status_code: int | None = None
     title: str | None = Field(default=None, max_length=1024)
@@ -187,7 +240,85 @@ class CrawlPageBase(SQLModel):
 
 
 class CrawlPage(CrawlPageBase, table=True):
+    # Several versions per URL, so a (non-unique) hash index, as in migration e7b4c2d9c001
+    __table_args__ = (Index("ix_crawlpage_url_fp", "url_fp", postgresql_using="hash"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    url_fp: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger, Computed(URL_FP_SQL.format("url"), persisted=True)
+        ),
+    )
+    # Node of the page in its job's latest link graph (see CrawlLink)
+    node_id: int | None = None
+    # SimHash of the page text; near-duplicates point at the first page of the crawl
+    simhash: int | None = Field(default=None, sa_column=Column(BigInteger))
+    duplicate_of: uuid.UUID | None = None
+    # Version of the page: stored by the run that first saw this content
+    run_id: uuid.UUID | None = None
+    content_hash: int | None = Field(default=None, sa_column=Column(BigInteger))
+
+
+# One crawl of a job; runs are numbered per job from 1
+class CrawlRun(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    job_id: uuid.UUID = Field(
+        foreign_key="scrapejob.id", ondelete="CASCADE", index=True
+    )
+    number: int
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    stats: dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
+
+
+class CrawlRunPublic(SQLModel):
+    id: uuid.UUID
+    job_id: uuid.UUID
+    number: int
+    started_at: datetime
+    finished_at: datetime | None = None
+    stats: dict[str, Any]
+
+
+class CrawlRunsPublic(SQLModel):
+    data: list[CrawlRunPublic]
+    count: int
+
+
+# What a run saw at a URL (by URL fingerprint): new, changed, removed, or unchanged.
+# Unchanged rows only reference the page version stored by an earlier run.
+class CrawlChange(SQLModel, table=True):
+    run_id: uuid.UUID = Field(
+        foreign_key="crawlrun.id", ondelete="CASCADE", primary_key=True
+    )
+    url_fp: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    kind: str = Field(max_length=16)
+    page_id: uuid.UUID
+
+
+class CrawlChangePublic(SQLModel):
+    url: str
+    kind: Literal["new", "changed", "removed"]
+    run: int
+    page_id: uuid.UUID
+    title: str | None = None
+
+
+class CrawlChangesPublic(SQLModel):
+    since: int
+    latest: int | None = None
+    data: list[CrawlChangePublic]
+    count: int
+
+
+# Link graph of a job's latest crawl, between node ids rather than URLs
+class CrawlLink(SQLModel, table=True):
+    job_id: uuid.UUID = Field(
+        foreign_key="scrapejob.id", ondelete="CASCADE", primary_key=True
+    )
+    source: int = Field(primary_key=True)
+    target: int = Field(primary_key=True)
 
 
 class CrawlPagePublic(CrawlPageBase):
@@ -195,5 +326,95 @@ class CrawlPagePublic(CrawlPageBase):
 
 
 class CrawlPagesPublic(SQLModel):
+    view: Literal["full"] = "full"
     data: list[CrawlPagePublic]
     count: int
+    next_cursor: str | None = None
+
+
+class CrawlPageSummary(SQLModel):
+    id: uuid.UUID
+    job_id: uuid.UUID
+    url: str
+    normalized_url: str
+    depth: int
+    status_code: int | None = None
+    title: str | None = None
+    score: float | None = None
+    fetched_at: datetime
+
+
+class CrawlPageSummariesPublic(SQLModel):
+    view: Literal["summary"] = "summary"
+    data: list[CrawlPageSummary]
+    count: int
+    next_cursor: str | None = None
+
+
+# Full-text search results over posts and crawl pages
+class SearchHit(SQLModel):
+    id: uuid.UUID
+    url: str
+    title: str | None = None
+    snippet: str | None = None
+    rank: float
+    company: str | None = None
+    platform: str | None = None
+    published_at: datetime | None = None
+    job_id: uuid.UUID | None = None
+
+
+class SearchResults(SQLModel):
+    data: list[SearchHit]
+    next_cursor: str | None = None
+
+
+# Configured company sources; ``weight`` multiplies the score of their posts
+class SourceBase(SQLModel):
+    company: str = Field(unique=True, max_length=128)
+    homepage: str = Field(max_length=2048)
+    weight: float = Field(default=1.2, gt=0)
+    enabled: bool = True
+
+
+class SourceCreate(SourceBase):
+    pass
+
+
+class SourceUpdate(SQLModel):
+    homepage: str | None = Field(default=None, max_length=2048)
+    weight: float | None = Field(default=None, gt=0)
+    enabled: bool | None = None
+
+
+class Source(SourceBase, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class SourcePublic(SourceBase):
+    id: uuid.UUID
+    updated_at: datetime
+
+
+class SourcesPublic(SQLModel):
+    data: list[SourcePublic]
+    count: int
+
+
+# Cached feed discovery per company source
+class FeedDiscovery(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    company: str = Field(unique=True, max_length=128)
+    homepage: str = Field(max_length=2048)
+    feeds: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
+    sitemaps: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
+    dead_urls: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
+    # Entry URLs the feeds/sitemaps returned on the last poll
+    entry_urls: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
+    discovered_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    validated_at: datetime | None = None
+    # Adaptive polling: smoothed seconds between posts and the next scheduled poll
+    post_interval_seconds: float | None = None
+    last_polled_at: datetime | None = None
+    next_poll_at: datetime | None = None
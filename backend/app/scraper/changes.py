@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import insert
+from sqlmodel import Session, func, select
+
+from app.models import CrawlChange, CrawlPage, CrawlRun
+
+NEW = "new"
+CHANGED = "changed"
+REMOVED = "removed"
+UNCHANGED = "unchanged"
+
+# Change records inserted per statement
+CHANGE_BATCH_SIZE = 10_000
+
+
+def content_hash(status_code: int | None, title: str | None, text: str | None) -> int:
+    """Signed 64-bit digest of what a crawl stores for a page; equal means unchanged."""
+    h = hashlib.blake2b(digest_size=8)
+    for part in (str(status_code), title or "", text or ""):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return int.from_bytes(h.digest(), "big", signed=True)
+
+
+class RunDiff:
+    """Classifies a run's pages against the previous finished run of the same job.
+
+    ``previous`` maps URL fingerprint to (page id, content hash) of the page
+    versions that run saw. Only new and changed pages need a new ``CrawlPage``;
+    unchanged ones are recorded as references to the version already stored.
+    """
+
+    def __init__(
+        self, run: CrawlRun, previous: dict[int, tuple[uuid.UUID, int | None]]
+    ) -> None:
+        self.run = run
+        self.previous = previous
+        self.records: list[dict[str, Any]] = []
+        self.counts: Counter[str] = Counter()
+        self._seen: set[int] = set()
+
+    def classify(self, url_fp: int, digest: int) -> tuple[str, uuid.UUID | None]:
+        """Kind of change, and the stored page id when the page is unchanged."""
+        prior = self.previous.get(url_fp)
+        if prior is None:
+            return NEW, None
+        if prior[1] == digest:
+            return UNCHANGED, prior[0]
+        return CHANGED, None
+
+    def record(self, url_fp: int, kind: str, page_id: uuid.UUID) -> None:
+        if url_fp in self._seen:
+            return
+        self._seen.add(url_fp)
+        self.records.append(
+            {"run_id": self.run.id, "url_fp": url_fp, "kind": kind, "page_id": page_id}
+        )
+        self.counts[kind] += 1
+
+    def close(self) -> None:
+        """Record previously seen URLs this run did not reach as removed."""
+        for url_fp, (page_id, _) in self.previous.items():
+            if url_fp not in self._seen:
+                self.record(url_fp, REMOVED, page_id)
+
+
+def start_run(session: Session, job_id: uuid.UUID) -> RunDiff:
+    """Open the next run of a job, with the page state of its last finished run."""
+    last = session.exec(
+        select(CrawlRun)
+        .where(CrawlRun.job_id == job_id, CrawlRun.finished_at.is_not(None))  # type: ignore[union-attr]
+        .order_by(CrawlRun.number.desc())  # type: ignore[attr-defined]
+        .limit(1)
+    ).first()
+    number = (
+        session.exec(
+            select(func.max(CrawlRun.number)).where(CrawlRun.job_id == job_id)
+        ).one()
+        or 0
+    )
+    run = CrawlRun(job_id=job_id, number=number + 1)
+    session.add(run)
+    session.commit()
+    session.refresh(run)
+    previous: dict[int, tuple[uuid.UUID, int | None]] = {}
+    if last is not None:
+        rows = session.exec(
+            select(CrawlChange.url_fp, CrawlChange.page_id, CrawlPage.content_hash)
+            .join(CrawlPage, CrawlPage.id == CrawlChange.page_id)  # type: ignore[arg-type]
+            .where(CrawlChange.run_id == last.id, CrawlChange.kind != REMOVED)
+        )
+        previous = {url_fp: (page_id, digest) for url_fp, page_id, digest in rows}
+    return RunDiff(run, previous)
+
+
+def finish_run(session: Session, diff: RunDiff) -> dict[str, int]:
+    diff.close()
+    for start in range(0, len(diff.records), CHANGE_BATCH_SIZE):
+        session.execute(
+            insert(CrawlChange), diff.records[start : start + CHANGE_BATCH_SIZE]
+        )
+    stats = {kind: diff.counts[kind] for kind in (NEW, CHANGED, REMOVED, UNCHANGED)}
+    diff.run.stats = stats
+    diff.run.finished_at = datetime.now(timezone.utc)
+    session.add(diff.run)
+    session.commit()
+    return stats
+
+
+def net_changes(
+    rows: Iterable[tuple[int, int, str, uuid.UUID]],
+) -> list[dict[str, Any]]:
+    """Net change per URL over ``(url_fp, run number, kind, page_id)`` records of
+    consecutive runs, in run order (unchanged records left out).
+
+    A URL that appeared and then went away again within the range is dropped; one
+    that existed before the range and still does is "changed".
+    """
+    first: dict[int, str] = {}
+    last: dict[int, tuple[int, str, uuid.UUID]] = {}
+    for url_fp, number, kind, page_id in rows:
+        first.setdefault(url_fp, kind)
+        last[url_fp] = (number, kind, page_id)
+    out = []
+    for url_fp, (number, kind, page_id) in last.items():
+        if first[url_fp] == NEW:
+            if kind == REMOVED:
+                continue
+            kind = NEW
+        elif kind != REMOVED:
+            kind = CHANGED
+        out.append({"url_fp": url_fp, "kind": kind, "run": number, "page_id": page_id})
+    return out
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import shutil
+import sqlite3
+import tempfile
+from collections import deque
+from types import TracebackType
+
+
+def url_fingerprint(url: str) -> int:
+    """Signed 64-bit fingerprint of a URL (fits a SQLite INTEGER / Postgres bigint).
+
+    The first 8 bytes of its MD5, so Postgres computes the same value for the
+    generated ``url_fp`` columns (``URL_FP_SQL`` in ``app.models``).
+    """
+    digest = hashlib.md5(url.encode("utf-8")).digest()[:8]
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter backed by a bytearray.
+
+    Sized from the expected number of items and the target false-positive rate;
+    bit positions come from double hashing a single 128-bit blake2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        m = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_bits = max(m, 8)
+        self.num_hashes = max(round(self.num_bits / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class UrlFrontier:
+    """FIFO crawl frontier with enqueue-time deduplication and a bounded memory footprint.
+
+    - Seen-set: a Bloom filter answers "definitely new" without touching anything else;
+      on a Bloom hit the exact 64-bit fingerprint is checked in memory, or in an on-disk
+      SQLite table once more than ``memory_items`` fingerprints have been recorded.
+    - Queue: at most ``memory_items`` entries are held in a deque; overflow is appended
+      to a spill file and read back in order once the in-memory head drains.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        memory_items: int = 100_000,
+        error_rate: float = 0.001,
+        spill_dir: str | None = None,
+    ) -> None:
+        self.memory_items = max(memory_items, 1)
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._seen: set[int] = set()
+        self._head: deque[tuple[str, int]] = deque()
+        self._spill_dir_arg = spill_dir
+        self._tmpdir: str | None = None
+        self._seen_db: sqlite3.Connection | None = None
+        self._spill_path: str | None = None
+        self._spill_read_pos = 0
+        self._spilled = 0
+
+    # Lifecycle
+    def __enter__(self) -> UrlFrontier:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._seen_db is not None:
+            self._seen_db.close()
+            self._seen_db = None
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def _workdir(self) -> str:
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="frontier-", dir=self._spill_dir_arg)
+        return self._tmpdir
+
+    # Seen-set
+    def _seen_exact(self, fp: int) -> bool:
+        if fp in self._seen:
+            return True
+        if self._seen_db is None:
+            return False
+        row = self._seen_db.execute("SELECT 1 FROM seen WHERE fp = ?", (fp,)).fetchone()
+        return row is not None
+
+    def _mark_seen(self, url: str, fp: int) -> None:
+        self._bloom.add(url)
+        self._seen.add(fp)
+        if len(self._seen) >= self.memory_items:
+            if self._seen_db is None:
+                self._seen_db = sqlite3.connect(
+                    os.path.join(self._workdir(), "seen.db")
+                )
+                self._seen_db.execute("PRAGMA journal_mode=OFF")
+                self._seen_db.execute("PRAGMA synchronous=OFF")
+                self._seen_db.execute("CREATE TABLE seen (fp INTEGER PRIMARY KEY)")
+            self._seen_db.executemany(
+                "INSERT OR IGNORE INTO seen (fp) VALUES (?)", ((f,) for f in self._seen)
+            )
+            self._seen_db.commit()
+            self._seen.clear()
+
+    def seen(self, url: str) -> bool:
+        if url not in self._bloom:
+            return False
+        return self._seen_exact(url_fingerprint(url))
+
+    # Queue
+    def push(self, url: str, depth: int) -> bool:
+        """Enqueue ``url`` unless it was pushed before. Returns True if it was added."""
+        if "\n" in url:
+            return False
+        fp = url_fingerprint(url)
+        if url in self._bloom and self._seen_exact(fp):
+            return False
+        self._mark_seen(url, fp)
+        if self._spilled or len(self._head) >= self.memory_items:
+            self._spill(url, depth)
+        else:
+            self._head.append((url, depth))
+        return True
+
+    def _spill(self, url: str, depth: int) -> None:
+        if self._spill_path is None:
+            self._spill_path = os.path.join(self._workdir(), "queue.txt")
+        with open(self._spill_path, "a", encoding="utf-8") as fh:
+            fh.write(f"{depth}\t{url}\n")
+        self._spilled += 1
+
+    def _refill(self) -> None:
+        if not self._spilled or self._spill_path is None:
+            return
+        with open(self._spill_path, encoding="utf-8") as fh:
+            fh.seek(self._spill_read_pos)
+            while self._spilled and len(self._head) < self.memory_items:
+                line = fh.readline()
+                if not line:
+                    break
+                depth, url = line.rstrip("\n").split("\t", 1)
+                self._head.append((url, int(depth)))
+                self._spilled -= 1
+            self._spill_read_pos = fh.tell()
+        if not self._spilled:
+            # Everything has been read back; start the next spill from an empty file
+            os.remove(self._spill_path)
+            self._spill_read_pos = 0
+
+    def pop(self) -> tuple[str, int]:
+        if not self._head:
+            self._refill()
+        return self._head.popleft()
+
+    def __len__(self) -> int:
+        return len(self._head) + self._spilled
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
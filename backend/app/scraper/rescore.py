@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from sqlalchemy import Float, Integer, Uuid, column, literal_column, update, values
+from sqlmodel import Session, col, select
+
+from app.core.cache import posts_generation
+from app.models import ScrapedPost
+
+from .scoring import DEFAULT_SOURCE_WEIGHT, score_posts
+from .sources import sources
+
+logger = logging.getLogger(__name__)
+
+# Posts read, scored and written back per round trip
+RESCORE_BATCH_SIZE = 5000
+
+# Stored length(content) (migration 9f3a6c15c001), so batches don't detoast content
+POST_CONTENT_LENGTH = literal_column("scrapedpost.content_length", type_=Integer)
+
+
+def _timestamps(published: Sequence[datetime | None]) -> np.ndarray:
+    return np.array(
+        [
+            np.nan
+            if p is None
+            else (p if p.tzinfo else p.replace(tzinfo=timezone.utc)).timestamp()
+            for p in published
+        ],
+        dtype=np.float64,
+    )
+
+
+def score_rows(
+    rows: Sequence[Any], weights: Mapping[str, float], now: datetime
+) -> tuple[list[uuid.UUID], np.ndarray]:
+    """Scores for ``(id, published_at, content_length, company)`` rows."""
+    ids, published, lengths, companies = zip(*rows, strict=True)
+    source_weight = np.array(
+        [weights.get(c, DEFAULT_SOURCE_WEIGHT) for c in companies], dtype=np.float64
+    )
+    scores = score_posts(
+        _timestamps(published),
+        np.array(lengths, dtype=np.float64),
+        source_weight,
+        now.timestamp(),
+    )
+    return list(ids), scores
+
+
+def _write_scores(session: Session, ids: list[uuid.UUID], scores: np.ndarray) -> int:
+    """Bulk ``UPDATE ... FROM (VALUES ...)``; rows whose score is unchanged are not touched."""
+    new = values(column("id", Uuid), column("score", Float), name="scores").data(
+        list(zip(ids, scores.tolist(), strict=True))
+    )
+    statement = (
+        update(ScrapedPost)
+        .where(
+            col(ScrapedPost.id) == new.c.id,
+            col(ScrapedPost.score).is_distinct_from(new.c.score),
+        )
+        .values(score=new.c.score)
+    )
+    return session.execute(statement).rowcount  # type: ignore[attr-defined, no-any-return]
+
+
+def rescore_posts(
+    session: Session,
+    *,
+    weights: Mapping[str, float] | None = None,
+    company: str | None = None,
+    batch_size: int = RESCORE_BATCH_SIZE,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """Recompute stored post scores (all posts, or one company's) in batches.
+
+    Posts are walked in id order with keyset paging and each batch is committed on
+    its own, so no long transaction or server-side cursor is held. ``weights`` maps
+    company to source weight. Returns the rows scanned and updated.
+    """
+    weights = weights or {}
+    now = now or datetime.now(timezone.utc)
+    statement = select(
+        ScrapedPost.id,
+        ScrapedPost.published_at,
+        POST_CONTENT_LENGTH,
+        ScrapedPost.company,
+    ).order_by(col(ScrapedPost.id))
+    if company is not None:
+        statement = statement.where(ScrapedPost.company == company)
+    scanned = updated = 0
+    last_id: uuid.UUID | None = None
+    while True:
+        batch = (
+            statement if last_id is None else statement.where(ScrapedPost.id > last_id)
+        )
+        rows = session.exec(batch.limit(batch_size)).all()
+        if not rows:
+            break
+        ids, scores = score_rows(rows, weights, now)
+        updated += _write_scores(session, ids, scores)
+        session.commit()
+        scanned += len(rows)
+        last_id = ids[-1]
+    if updated:
+        posts_generation.bump()
+    return {"scanned": scanned, "updated": updated}
+
+
+def rescore_blocking(company: str | None = None) -> dict[str, int]:
+    """Rescore posts with a sync session of its own; meant for a worker thread."""
+    from app.core.db import engine
+
+    with Session(engine) as session:
+        return rescore_posts(session, weights=sources.weights(), company=company)
+
+
+async def rescore_periodically(interval_seconds: float) -> None:
+    """Keep the recency term of stored scores fresh by rescoring on an interval."""
+    while True:
+        try:
+            result = await asyncio.to_thread(rescore_blocking)
+            logger.info("Rescored posts: %s", result)
+        except Exception:
+            logger.exception("Rescoring posts failed")
+        await asyncio.sleep(interval_seconds)
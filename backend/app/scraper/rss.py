@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, cast
 from xml.etree import ElementTree as ET
 
-from .utils import fetch_text
+import httpx
+
+from .utils import USER_AGENT, content_fingerprint
 
 
 def parse_rfc2822(date_str: str) -> datetime | None:
@@ -29,61 +32,170 @@ def parse_w3c(date_str: str) -> datetime | None:
         return None
 
 
-def fetch_feed_entries(feed_url: str, max_items: int = 100) -> list[dict[str, Any]]:
-    xml_text = fetch_text(feed_url)
-    if not xml_text:
-        return []
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def _text(el: ET.Element | None) -> str | None:
+    return el.text.strip() if el is not None and el.text else None
+
+
+def _rss_item(item: ET.Element) -> dict[str, Any]:
+    pub = _text(item.find("pubDate"))
+    return {
+        "title": _text(item.find("title")),
+        "url": _text(item.find("link")),
+        "content": _text(item.find("description")),
+        "published_at": parse_rfc2822(pub) if pub else None,
+    }
+
+
+def _atom_entry(entry: ET.Element) -> dict[str, Any]:
+    link_el = entry.find(f"{ATOM}link")
+    updated = _text(entry.find(f"{ATOM}updated")) or _text(entry.find(f"{ATOM}published"))
+    return {
+        "title": _text(entry.find(f"{ATOM}title")),
+        "url": link_el.attrib.get("href") if link_el is not None else None,
+        "content": _text(entry.find(f"{ATOM}content")),
+        "published_at": parse_w3c(updated) if updated else None,
+    }
+
+
+class FeedStreamParser:
+    """Incremental RSS 2.0 / Atom parser fed with raw bytes as they arrive.
+
+    Each ``<item>``/``<entry>`` is converted as soon as it closes and then detached
+    from the tree, so memory stays proportional to the entries kept. ``known`` maps
+    already stored URLs to their ``content_fingerprint``; unchanged known entries are
+    skipped, and after ``stop_after_known`` of them in a row parsing stops, as the
+    rest of the feed is assumed to be older content. ``urls`` lists every entry URL
+    read, skipped or not.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 100,
+        known: Mapping[str, str] | None = None,
+        stop_after_known: int = 5,
+    ) -> None:
+        self.max_items = max_items
+        self.known = known or {}
+        self.stop_after_known = stop_after_known
+        self.items: list[dict[str, Any]] = []
+        self.urls: list[str] = []
+        self.is_feed = False
+        self.done = False
+        self._known_run = 0
+        self._parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+
+    def feed(self, data: bytes) -> bool:
+        """Consume a chunk; returns True once no more input is needed."""
+        if self.done:
+            return True
+        try:
+            self._parser.feed(data)
+            self._drain()
+        except ET.ParseError:
+            self.done = True
+        return self.done
+
+    def close(self) -> list[dict[str, Any]]:
+        if not self.done:
+            try:
+                self._parser.close()
+                self._drain()
+            except ET.ParseError:
+                pass
+            self.done = True
+        return self.items
+
+    def _drain(self) -> None:
+        # Only "start"/"end" were requested, so every event is an (event, element) pair
+        events = cast("Iterator[tuple[str, Any]]", self._parser.read_events())
+        for event, elem in events:
+            if not isinstance(elem, ET.Element):
+                continue
+            if event == "start":
+                if not self._stack:
+                    self.is_feed = elem.tag == "rss" or elem.tag == f"{ATOM}feed"
+                self._stack.append(elem)
+                continue
+            self._stack.pop()
+            if elem.tag == "item":
+                entry = _rss_item(elem)
+            elif elem.tag == f"{ATOM}entry":
+                entry = _atom_entry(elem)
+            else:
+                continue
+            if self._stack:
+                self._stack[-1].remove(elem)
+            elem.clear()
+            self._add(entry)
+            if self.done:
+                return
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        url = entry["url"]
+        if not url:
+            return
+        self.urls.append(url)
+        stored = self.known.get(url)
+        if stored is not None and stored == content_fingerprint(entry["title"], entry["content"]):
+            self._known_run += 1
+            if self._known_run >= self.stop_after_known:
+                self.done = True
+            return
+        self._known_run = 0
+        self.items.append(entry)
+        if len(self.items) >= self.max_items:
+            self.done = True
+
+
+def parse_feed(xml_text: str, max_items: int = 100) -> list[dict[str, Any]]:
+    parser = FeedStreamParser(max_items=max_items)
+    parser.feed(xml_text.encode("utf-8"))
+    return parser.close()
+
+
+def fetch_feed_entries(
+    feed_url: str, max_items: int = 100, known: Mapping[str, str] | None = None
+) -> list[dict[str, Any]]:
+    parser = FeedStreamParser(max_items=max_items, known=known)
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return []
-
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-    items: list[dict[str, Any]] = []
-    if root.tag.endswith("rss") or root.find("channel") is not None:
-        # RSS 2.0
-        channel = root.find("channel") or root
-        for item in channel.findall("item"):
-            title_el = item.find("title")
-            link_el = item.find("link")
-            desc_el = item.find("description")
-            pub_el = item.find("pubDate")
-            title = title_el.text.strip() if title_el is not None and title_el.text else None
-            link = link_el.text.strip() if link_el is not None and link_el.text else None
-            description = desc_el.text.strip() if desc_el is not None and desc_el.text else None
-            published_at = parse_rfc2822(pub_el.text.strip()) if pub_el is not None and pub_el.text else None
-            if link:
-                items.append(
-                    {
-                        "title": title,
-                        "url": link,
-                        "content": description,
-                        "published_at": published_at,
-                    }
-                )
-            if len(items) >= max_items:
-                break
-    else:
-        # Atom
-        for entry in root.findall("atom:entry", ns):
-            title_el = entry.find("atom:title", ns)
-            link_el = entry.find("atom:link", ns)
-            content_el = entry.find("atom:content", ns)
-            updated_el = entry.find("atom:updated", ns) or entry.find("atom:published", ns)
-            link = link_el.attrib.get("href") if link_el is not None else None
-            title = title_el.text.strip() if title_el is not None and title_el.text else None
-            content = content_el.text.strip() if content_el is not None and content_el.text else None
-            published_at = parse_w3c(updated_el.text.strip()) if updated_el is not None and updated_el.text else None
-            if link:
-                items.append(
-                    {
-                        "title": title,
-                        "url": link,
-                        "content": content,
-                        "published_at": published_at,
-                    }
-                )
-            if len(items) >= max_items:
-                break
-    return items
+        with httpx.stream(
+            "GET", feed_url, headers={"User-Agent": USER_AGENT}, timeout=15.0, follow_redirects=True
+        ) as resp:
+            if resp.status_code >= 400:
+                return []
+            for chunk in resp.iter_bytes():
+                if parser.feed(chunk):
+                    break
+    except Exception:
+        pass
+    return parser.close()
+
+
+async def fetch_feed_async(
+    client: httpx.AsyncClient,
+    feed_url: str,
+    max_items: int = 100,
+    known: Mapping[str, str] | None = None,
+) -> FeedStreamParser | None:
+    """Stream ``feed_url`` through a ``FeedStreamParser``; None if the request failed.
+
+    The download is abandoned as soon as the parser has what it needs.
+    """
+    parser = FeedStreamParser(max_items=max_items, known=known)
+    try:
+        async with client.stream("GET", feed_url) as resp:
+            if resp.status_code >= 400:
+                return None
+            async for chunk in resp.aiter_bytes():
+                if parser.feed(chunk):
+                    break
+    except Exception:
+        if not parser.items:
+            return None
+    parser.close()
+    return parser
+
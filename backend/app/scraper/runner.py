@@ -1,66 +1,285 @@
 from __future__ import annotations
 
-from collections import deque
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import urljoin, urlparse
 import re
 
+import httpx
 from bs4 import BeautifulSoup  # type: ignore
+from sqlalchemy import or_
 from sqlmodel import Session, select
 
-from app.models import ScrapedPost, ScrapeJob, CrawlPage
-from .website import normalize_entries, scrape_homepage_sources
+from app.core.cache import posts_generation
+from app.models import ScrapedPost, ScrapeJob, CrawlPage, FeedDiscovery
+from .changes import UNCHANGED, content_hash, finish_run, start_run
+from .frontier import UrlFrontier, url_fingerprint
+from .linkgraph import LinkGraph, assign_nodes, rank_pages, reset_graph, store_edges
+from .simhash import MAX_DISTANCE, SimHashIndex, band_sql, bands, hamming, simhash
+from .scheduler import due_companies, update_poll_schedule
+from .sources import sources
+from .utils import make_async_client
+from .website import (
+    Discovery,
+    normalize_entries,
+    scrape_homepage_sources_async,
+    scrape_known_sources_async,
+)
 from app.core.config import settings
 
-DEFAULT_SOURCES: dict[str, dict[str, Any]] = {
-    # You can expand or override these via API or config later
-    "laudos.ai": {"homepage": "https://laudos.ai/"},
-    "laudos": {"homepage": "https://home.laudos.ai/"},
-    "laudite": {"homepage": "https://laudite.com.br/"},
-    "leorad": {"homepage": "https://leorad.com/"},  # placeholder
-}
+logger = logging.getLogger(__name__)
+
+
+def find_near_duplicate_post(
+    session: Session, fingerprint: int, exclude: uuid.UUID | None = None
+) -> uuid.UUID | None:
+    """Id of a canonical post whose SimHash is within ``MAX_DISTANCE`` bits, via the
+    band indexes (candidates share at least one band). ``exclude`` is a post not to
+    match, i.e. the one being updated."""
+    column = ScrapedPost.__table__.c.simhash  # type: ignore[attr-defined]
+    statement = (
+        select(ScrapedPost.id, column)
+        .where(
+            column.is_not(None),
+            ScrapedPost.duplicate_of.is_(None),  # type: ignore[union-attr]
+            or_(*(expr == key for expr, key in zip(band_sql(column), bands(fingerprint), strict=True))),
+        )
+        .limit(100)
+    )
+    if exclude is not None:
+        statement = statement.where(ScrapedPost.id != exclude)
+    for post_id, other in session.exec(statement):
+        if hamming(fingerprint, other) <= MAX_DISTANCE:
+            return post_id
+    return None
 
 
 def upsert_post(session: Session, data: dict[str, Any]) -> bool:
-    existing = session.exec(select(ScrapedPost).where(ScrapedPost.url == data["url"])).first()
+    existing = session.exec(
+        select(ScrapedPost).where(ScrapedPost.url_fp == url_fingerprint(data["url"]))
+    ).first()
+    if existing and existing.url != data["url"]:
+        # Fingerprint collision: url_fp is unique, so the second URL can't be stored
+        logger.warning("URL fingerprint collision between %s and %s; skipping", existing.url, data["url"])
+        return False
     if existing:
         changed = False
-        fields = ["title", "content", "published_at", "score"]
+        fields = ["title", "content", "published_at", "score", "simhash"]
         for f in fields:
             v = data.get(f)
             if v is not None and getattr(existing, f) != v:
                 setattr(existing, f, v)
                 changed = True
+                if f == "simhash":
+                    # The text changed: it may (no longer) duplicate another post
+                    existing.duplicate_of = find_near_duplicate_post(session, v, exclude=existing.id)
         if changed:
             session.add(existing)
             session.commit()
             session.refresh(existing)
+            posts_generation.bump()
             return True
         return False
     obj = ScrapedPost(**data)
+    if obj.simhash is not None:
+        obj.duplicate_of = find_near_duplicate_post(session, obj.simhash)
     session.add(obj)
     session.commit()
     session.refresh(obj)
+    posts_generation.bump()
     return True
 
 
-def run_scraping_for_company(*, session: Session, company: str) -> dict[str, Any]:
-    cfg = DEFAULT_SOURCES.get(company) or DEFAULT_SOURCES.get(company.lower())
-    if not cfg:
-        return {"inserted": 0, "updated": 0, "message": "No configured sources for company"}
-    homepage = cfg.get("homepage")
-    if not homepage:
-        return {"inserted": 0, "updated": 0, "message": "No homepage configured"}
-
-    raw_entries = scrape_homepage_sources(homepage)
-    entries = normalize_entries(company=company, platform="website", entries=raw_entries)
-
+def _store_entries(session: Session, company: str, raw_entries: list[dict[str, Any]]) -> int:
+    entries = normalize_entries(
+        company=company, platform="website", entries=raw_entries, source_weight=sources.weight(company)
+    )
     inserted = 0
     for e in entries:
         changed = upsert_post(session, e)
         if changed:
             inserted += 1
-    return {"inserted": inserted, "source": homepage}
+    return inserted
+
+
+def _company_homepage(company: str) -> tuple[str | None, dict[str, Any] | None]:
+    source = sources.get(company)
+    if not source:
+        return None, {"inserted": 0, "updated": 0, "message": "No configured sources for company"}
+    homepage = source.homepage
+    if not homepage:
+        return None, {"inserted": 0, "updated": 0, "message": "No homepage configured"}
+    return homepage, None
+
+
+def _load_known_posts(session: Session, cache: dict[str, FeedDiscovery]) -> dict[str, dict[str, str]]:
+    """Map company -> {url: content fingerprint} for stored posts the company's feeds
+    returned on their last poll (``FeedDiscovery.entry_urls``).
+
+    Loaded once per run so feed parsing can skip (and stop at) unchanged entries. Only
+    URLs still in the feed window are looked up, by URL fingerprint, and the digest is
+    the stored ``content_fp`` column, so the cost does not grow with the archive.
+    """
+    fingerprints = {url_fingerprint(url) for d in cache.values() for url in d.entry_urls}
+    known: dict[str, dict[str, str]] = {}
+    if not fingerprints:
+        return known
+    statement = select(ScrapedPost.company, ScrapedPost.url, ScrapedPost.content_fp).where(
+        ScrapedPost.url_fp.in_(fingerprints),  # type: ignore[union-attr]
+        ScrapedPost.company.in_(list(cache)),  # type: ignore[attr-defined]
+    )
+    for company, url, digest in session.exec(statement):
+        if digest is not None:
+            known.setdefault(company, {})[url] = digest
+    return known
+
+
+def _discovery_is_fresh(cached: FeedDiscovery, homepage: str, now: datetime) -> bool:
+    """Whether the cached discovery (live and dead candidates) can still be trusted.
+
+    Independent of whether any feed was found: a source without one is exactly
+    where skipping the known-dead candidates saves the most requests.
+    """
+    if cached.homepage != homepage:
+        return False
+    discovered_at = cached.discovered_at
+    if discovered_at.tzinfo is None:
+        discovered_at = discovered_at.replace(tzinfo=timezone.utc)
+    return now - discovered_at < timedelta(hours=settings.SCRAPER_DISCOVERY_TTL_HOURS)
+
+
+async def _collect_company_entries(
+    client: httpx.AsyncClient,
+    homepage: str,
+    cached: FeedDiscovery | None,
+    known: dict[str, str],
+    now: datetime,
+) -> tuple[Discovery, bool]:
+    """Return the collected entries and whether a full discovery was run.
+
+    Fresh cache entries go straight to the known-good feeds. If there are none, or none
+    of them is alive any more, the source is rediscovered, skipping candidates already
+    known to be dead.
+    """
+    if cached and _discovery_is_fresh(cached, homepage, now):
+        if cached.feeds or cached.sitemaps:
+            result = await scrape_known_sources_async(client, cached.feeds, cached.sitemaps, known=known)
+            if result.feeds or result.sitemaps:
+                return result, False
+        return (
+            await scrape_homepage_sources_async(
+                homepage, client, skip=set(cached.dead_urls), known=known
+            ),
+            True,
+        )
+    return await scrape_homepage_sources_async(homepage, client, known=known), True
+
+
+def _save_discovery(
+    session: Session,
+    *,
+    company: str,
+    homepage: str,
+    cached: FeedDiscovery | None,
+    discovery: Discovery,
+    rediscovered: bool,
+    now: datetime,
+) -> FeedDiscovery:
+    revalidation = cached is not None and _discovery_is_fresh(cached, homepage, now)
+    if cached is None:
+        cached = FeedDiscovery(company=company, homepage=homepage)
+    if rediscovered:
+        dead = set(discovery.dead)
+        if revalidation:
+            # Dead candidates were skipped this time, so keep them
+            dead.update(cached.dead_urls)
+        cached.homepage = homepage
+        cached.feeds = discovery.feeds
+        cached.sitemaps = discovery.sitemaps
+        cached.dead_urls = sorted(dead - set(discovery.feeds) - set(discovery.sitemaps))
+        if not revalidation:
+            # Only a full discovery restarts the TTL, so dead candidates are re-probed
+            # once it runs out
+            cached.discovered_at = now
+    cached.entry_urls = list(dict.fromkeys(discovery.urls))
+    cached.validated_at = now
+    session.add(cached)
+    session.commit()
+    return cached
+
+
+def run_scraping_blocking(companies: list[str] | None = None, *, due_only: bool = False) -> dict[str, dict[str, Any]]:
+    """Scrape ``companies`` with a sync session of its own; meant for a worker thread.
+
+    The database work and the scrape's event loop both stay on the calling thread, so
+    async callers (routes, the poll scheduler) hand this to a threadpool instead of
+    blocking their loop. ``companies`` defaults to every enabled source; ``due_only``
+    skips companies whose next poll is not due yet.
+    """
+    from app.core.db import engine
+
+    if companies is None:
+        companies = sources.enabled_companies()
+    with Session(engine) as session:
+        if due_only:
+            companies = due_companies(session, companies, datetime.now(timezone.utc))
+        if not companies:
+            return {}
+        return asyncio.run(run_scraping_for_companies(session=session, companies=companies))
+
+
+async def run_scraping_for_companies(*, session: Session, companies: list[str]) -> dict[str, dict[str, Any]]:
+    """Scrape several companies, running every company's discovery concurrently.
+
+    All network requests share one client, so a run is bounded by the slowest host
+    rather than the sum of all requests; database writes happen afterwards. Discovered
+    feeds are cached per company (see ``FeedDiscovery``) so most runs only fetch the
+    known feeds.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    homepages: dict[str, str] = {}
+    for company in companies:
+        homepage, error = _company_homepage(company)
+        if error or not homepage:
+            results[company] = error or {}
+        else:
+            homepages[company] = homepage
+
+    cache = {
+        d.company: d
+        for d in session.exec(select(FeedDiscovery).where(FeedDiscovery.company.in_(list(homepages))))  # type: ignore[attr-defined]
+    }
+    known = _load_known_posts(session, cache)
+    now = datetime.now(timezone.utc)
+    async with make_async_client() as client:
+        collected = await asyncio.gather(
+            *(
+                _collect_company_entries(client, homepage, cache.get(company), known.get(company, {}), now)
+                for company, homepage in homepages.items()
+            )
+        )
+    for (company, homepage), (discovery, rediscovered) in zip(homepages.items(), collected, strict=True):
+        source = _save_discovery(
+            session,
+            company=company,
+            homepage=homepage,
+            cached=cache.get(company),
+            discovery=discovery,
+            rediscovered=rediscovered,
+            now=now,
+        )
+        inserted = _store_entries(session, company, discovery.entries)
+        update_poll_schedule(session, source, now)
+        results[company] = {
+            "inserted": inserted,
+            "source": homepage,
+            "discovered": rediscovered,
+            "next_poll_at": source.next_poll_at.isoformat() if source.next_poll_at else None,
+        }
+    return {company: results[company] for company in companies}
 
 
 # Firecrawl-like BFS crawler
@@ -84,24 +303,45 @@ def _match_any(url: str, patterns: list[str]) -> bool:
     return False
 
 
+def crawl_job_blocking(job_id: Any) -> dict[str, Any]:
+    """Run a job's crawl with a sync session of its own; meant for a worker thread."""
+    from app.core.db import engine
+
+    with Session(engine) as session:
+        job = session.get(ScrapeJob, job_id)
+        if job is None:
+            raise ValueError(f"Job {job_id} not found")
+        return bfs_crawl(session=session, job=job)
+
+
 def bfs_crawl(*,
     session: Session,
     job: ScrapeJob,
 ) -> dict[str, Any]:
-    visited: set[str] = set()
-    q: deque[tuple[str, int]] = deque()
+    with UrlFrontier(
+        capacity=max(job.max_pages * 50, 10_000),
+        memory_items=settings.CRAWL_FRONTIER_MEMORY_ITEMS,
+        spill_dir=settings.CRAWL_FRONTIER_SPILL_DIR,
+    ) as frontier:
+        return _bfs_crawl(session=session, job=job, frontier=frontier)
+
+
+def _bfs_crawl(*, session: Session, job: ScrapeJob, frontier: UrlFrontier) -> dict[str, Any]:
+    reset_graph(session, job.id)
+    graph = LinkGraph()
+    # Compared with the previous run: only new and changed pages are stored again
+    diff = start_run(session, job.id)
+    unchanged_nodes: dict[uuid.UUID, int] = {}
+    # Near-duplicate pages of this crawl (print views, paginated archives, ...)
+    seen_text = SimHashIndex()
     for seed in job.seeds:
-        q.append((seed, 0))
+        frontier.push(seed, 0)
     pages = 0
     created = 0
+    duplicates = 0
 
-    while q and pages < job.max_pages:
-        url, depth = q.popleft()
-        if url in visited:
-            continue
-        visited.add(url)
-        if depth > job.max_depth:
-            continue
+    while frontier and pages < job.max_pages:
+        url, depth = frontier.pop()
         if not _allowed(url, job.allowed_domains):
             continue
         # Fetch
@@ -120,16 +360,23 @@ def bfs_crawl(*,
         except Exception:
             status_code = 0
             html = ""
+        node_id = graph.node(url)
+        page_id = uuid.uuid4()
         # Parse title/text
         title = None
         text = None
+        fingerprint = None
+        duplicate_of = None
         if html:
             try:
                 soup = BeautifulSoup(html, "html.parser")
                 title = (soup.title.string or "").strip() if soup.title else None
                 text = soup.get_text(" ", strip=True)
-                # Enqueue links
-                for a in soup.find_all("a", href=True):
+                fingerprint = simhash(text)
+                if fingerprint is not None:
+                    duplicate_of = seen_text.near(fingerprint)
+                # Enqueue links; a near-duplicate's links are the original's, so skip them
+                for a in soup.find_all("a", href=True) if duplicate_of is None else ():
                     href = a.get("href")
                     if not href:
                         continue
@@ -140,12 +387,30 @@ def bfs_crawl(*,
                         continue
                     if job.exclude_patterns and _match_any(full, job.exclude_patterns):
                         continue
-                    if full not in visited:
-                        q.append((full, depth + 1))
+                    graph.add_edge(node_id, graph.node(full))
+                    if depth < job.max_depth:
+                        frontier.push(full, depth + 1)
             except Exception:
                 pass
+        pages += 1
+        url_fp = url_fingerprint(url)
+        digest = content_hash(status_code, title, text)
+        kind, stored_id = diff.classify(url_fp, digest)
+        if fingerprint is not None and duplicate_of is None:
+            seen_text.add(fingerprint, stored_id or page_id)
+        if kind == UNCHANGED and stored_id is not None:
+            diff.record(url_fp, kind, stored_id)
+            unchanged_nodes[stored_id] = node_id
+            if duplicate_of is not None:
+                duplicates += 1
+            continue
+        if duplicate_of is not None:
+            # Keep the row (and its link to the original) but not a second copy of the text
+            text = None
+            duplicates += 1
         # Save page
         page = CrawlPage(
+            id=page_id,
             job_id=job.id,
             url=url,
             normalized_url=url,
@@ -153,13 +418,30 @@ def bfs_crawl(*,
             status_code=status_code,
             title=title,
             content_text=text,
+            node_id=node_id,
+            simhash=fingerprint,
+            duplicate_of=duplicate_of,
+            run_id=diff.run.id,
+            content_hash=digest,
         )
         session.add(page)
         session.commit()
-        session.refresh(page)
+        diff.record(url_fp, kind, page_id)
         created += 1
-        pages += 1
 
-    stats = {"pages": pages, "created": created}
+    changes = finish_run(session, diff)
+    assign_nodes(session, unchanged_nodes)
+    store_edges(session, job.id, graph)
+    # Post-crawl stage: link-based importance for every fetched page
+    ranking = rank_pages(session, job.id)
+    stats = {
+        "run": diff.run.number,
+        "pages": pages,
+        "created": created,
+        **changes,
+        "duplicates": duplicates,
+        "links": ranking["edges"],
+        "ranked": ranking["scored"],
+    }
     job.stats = stats
     return stats
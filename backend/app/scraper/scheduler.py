@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import statistics
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+
+from sqlmodel import Session, col, func, select
+
+from app.core.config import settings
+from app.models import FeedDiscovery, ScrapedPost
+
+from .sources import sources
+
+logger = logging.getLogger(__name__)
+
+# Number of most recent posts used to estimate a source's posting interval
+INTERVAL_SAMPLE = 10
+
+
+def observed_interval(published: Sequence[datetime], now: datetime) -> float | None:
+    """Estimate seconds between posts from publication dates (any order).
+
+    Uses the median gap between consecutive posts, stretched to the time since the
+    latest post so sources that went quiet back off. None with fewer than two dates.
+    """
+    if len(published) < 2:
+        return None
+    ordered = sorted(published)
+    gaps = [(b - a).total_seconds() for a, b in pairwise(ordered)]
+    median_gap = statistics.median(gaps)
+    since_latest = (now - ordered[-1]).total_seconds()
+    return max(median_gap, since_latest, 0.0)
+
+
+def next_poll_delay(
+    interval: float | None,
+    *,
+    min_seconds: float,
+    max_seconds: float,
+    jitter: float = 0.1,
+    rng: random.Random | None = None,
+) -> float:
+    """Seconds until the next poll: half the posting interval, bounded and jittered."""
+    if interval is None:
+        # Unknown cadence: start in the (geometric) middle of the bounds
+        base = math.sqrt(min_seconds * max_seconds)
+    else:
+        base = interval / 2
+    base = min(max(base, min_seconds), max_seconds)
+    factor = (rng or random).uniform(1 - jitter, 1 + jitter)
+    return min(max(base * factor, min_seconds), max_seconds)
+
+
+def update_poll_schedule(
+    session: Session, source: FeedDiscovery, now: datetime
+) -> None:
+    """Record a poll of ``source`` and schedule its next one from recent post dates."""
+    statement = (
+        select(ScrapedPost.published_at)
+        .where(
+            ScrapedPost.company == source.company,
+            col(ScrapedPost.published_at).is_not(None),
+        )
+        .order_by(col(ScrapedPost.published_at).desc())
+        .limit(INTERVAL_SAMPLE)
+    )
+    published = [
+        p if p.tzinfo else p.replace(tzinfo=timezone.utc)
+        for p in session.exec(statement)
+        if p
+    ]
+    observed = observed_interval(published, now)
+    if observed is not None and source.post_interval_seconds is not None:
+        # Smooth so a single burst or gap does not swing the cadence
+        observed = 0.5 * source.post_interval_seconds + 0.5 * observed
+    if observed is not None:
+        source.post_interval_seconds = observed
+    delay = next_poll_delay(
+        source.post_interval_seconds,
+        min_seconds=settings.SCRAPER_POLL_MIN_MINUTES * 60,
+        max_seconds=settings.SCRAPER_POLL_MAX_HOURS * 3600,
+        jitter=settings.SCRAPER_POLL_JITTER,
+    )
+    source.last_polled_at = now
+    source.next_poll_at = now + timedelta(seconds=delay)
+    session.add(source)
+    session.commit()
+
+
+def due_companies(session: Session, companies: list[str], now: datetime) -> list[str]:
+    """Companies whose next poll is due (never-polled companies are always due)."""
+    scheduled = {
+        d.company: d.next_poll_at
+        for d in session.exec(
+            select(FeedDiscovery).where(col(FeedDiscovery.company).in_(companies))
+        )
+    }
+    due: list[str] = []
+    for company in companies:
+        next_poll_at = scheduled.get(company)
+        if next_poll_at is not None and next_poll_at.tzinfo is None:
+            next_poll_at = next_poll_at.replace(tzinfo=timezone.utc)
+        if next_poll_at is None or next_poll_at <= now:
+            due.append(company)
+    return due
+
+
+def seconds_until_next_poll(
+    session: Session, companies: list[str], now: datetime
+) -> float:
+    statement = select(func.count(), func.min(FeedDiscovery.next_poll_at)).where(
+        FeedDiscovery.company.in_(companies)  # type: ignore[attr-defined]
+    )
+    scheduled, earliest = session.exec(statement).one()
+    if scheduled < len(set(companies)) or earliest is None:
+        return 0.0
+    if earliest.tzinfo is None:
+        earliest = earliest.replace(tzinfo=timezone.utc)
+    return max((earliest - now).total_seconds(), 0.0)
+
+
+class PollScheduler:
+    """In-process loop polling each company when its adaptive schedule says so.
+
+    Due companies are scraped together (their requests run concurrently), then the
+    loop sleeps until the earliest next poll.
+    """
+
+    def __init__(self, companies: list[str] | None = None) -> None:
+        # None: every enabled source, re-read on each run
+        self.companies = companies
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self) -> dict[str, dict[str, object]]:
+        from app.scraper.runner import run_scraping_blocking
+
+        # Sync DB work runs in a worker thread so the API's event loop stays free
+        return await asyncio.to_thread(
+            run_scraping_blocking, self.companies, due_only=True
+        )
+
+    def _sleep_seconds(self) -> float:
+        from app.core.db import engine
+
+        companies = (
+            self.companies
+            if self.companies is not None
+            else sources.enabled_companies()
+        )
+        if not companies:
+            return settings.SCRAPER_POLL_MIN_MINUTES * 60
+        with Session(engine) as session:
+            delay = seconds_until_next_poll(
+                session, companies, datetime.now(timezone.utc)
+            )
+        return max(delay, settings.SCRAPER_POLL_MIN_MINUTES * 60 * 0.1)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                results = await self.run_once()
+                if results:
+                    logger.info("Scheduled scrape finished: %s", results)
+                delay = await asyncio.to_thread(self._sleep_seconds)
+            except Exception:
+                logger.exception("Scheduled scrape failed")
+                delay = settings.SCRAPER_POLL_MIN_MINUTES * 60
+            await asyncio.sleep(delay)
@@ -1,27 +1,78 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from sqlalchemy import Numeric, case, cast, func
+
+# Formula constants, shared by the per-post and vectorized scorers
+HALF_LIFE_DAYS = 90
+UNKNOWN_DATE_RECENCY = 0.3  # unknown date still gets a small baseline
+FULL_LENGTH_CHARS = 4000
+RECENCY_WEIGHT = 0.6
+LENGTH_WEIGHT = 0.4
+# Weight of a source without an explicit one
+DEFAULT_SOURCE_WEIGHT = 1.2
 
 
 def score_post(*, published_at: datetime | None, content_length: int | None, source_weight: float = 1.0) -> float:
     """Compute a 0-100 score favoring recent, substantial content.
 
-    - Recency: exponential decay over 365 days
-    - Length: logarithmic benefit up to ~4k chars
+    - Recency: exponential decay with a 90-day half-life
+    - Length: linear benefit up to ~4k chars
     - Source weight: multiplier for trusted sources (e.g., official blog > social repost)
     """
     now = datetime.now(timezone.utc)
 
     # Recency component (0..1)
     if published_at is None:
-        recency = 0.3  # unknown date still gets a small baseline
+        recency = UNKNOWN_DATE_RECENCY
     else:
         days = max((now - published_at).days, 0)
-        half_life_days = 90
-        recency = 2 ** (-(days / half_life_days))  # half every 90 days
+        recency = 2 ** (-(days / HALF_LIFE_DAYS))  # half every 90 days
 
     # Length component (0..1)
     n = max(content_length or 0, 0)
-    length = min((n / 4000.0), 1.0) if n < 4000 else 1.0
-    base = 0.6 * recency + 0.4 * length
+    length = min((n / FULL_LENGTH_CHARS), 1.0)
+    base = RECENCY_WEIGHT * recency + LENGTH_WEIGHT * length
     return round(max(0.0, min(100.0, 100.0 * base * source_weight)), 2)
+
+
+def score_posts(
+    published_ts: np.ndarray, content_length: np.ndarray, source_weight: np.ndarray, now_ts: float
+) -> np.ndarray:
+    """Vectorized ``score_post`` over arrays (one element per post).
+
+    ``published_ts`` holds POSIX timestamps with NaN for unknown dates; ``now_ts`` is
+    the reference time, also as a timestamp.
+    """
+    days = np.maximum(np.floor((now_ts - published_ts) / 86400.0), 0.0)
+    recency = np.where(np.isnan(published_ts), UNKNOWN_DATE_RECENCY, np.exp2(-days / HALF_LIFE_DAYS))
+    length = np.minimum(np.maximum(content_length, 0) / FULL_LENGTH_CHARS, 1.0)
+    base = RECENCY_WEIGHT * recency + LENGTH_WEIGHT * length
+    return np.round(np.clip(100.0 * base * source_weight, 0.0, 100.0), 2)
+
+
+def score_sql(published_at: Any, content_length: Any, source_weight: Any, now: Any) -> Any:
+    """``score_post`` as a SQL expression over columns/binds (``now`` a timestamptz)."""
+    days = func.greatest(func.floor(func.extract("epoch", now - published_at) / 86400), 0)
+    # GREATEST ignores NULLs, so an unknown date has to be caught before it
+    recency = case(
+        (published_at.is_(None), UNKNOWN_DATE_RECENCY), else_=func.power(2.0, -days / HALF_LIFE_DAYS)
+    )
+    length = func.least(func.greatest(func.coalesce(content_length, 0), 0) / float(FULL_LENGTH_CHARS), 1.0)
+    base = RECENCY_WEIGHT * recency + LENGTH_WEIGHT * length
+    return func.round(cast(func.least(func.greatest(100.0 * base * source_weight, 0.0), 100.0), Numeric), 2)
+
+
+def recency_cutoff_days(min_score: float, max_source_weight: float) -> float | None:
+    """Age in days beyond which no post can reach ``min_score``, even at full length.
+
+    None when any age can still reach it (length alone suffices).
+    """
+    needed = (min_score / (100.0 * max_source_weight) - LENGTH_WEIGHT) / RECENCY_WEIGHT
+    if needed <= 0:
+        return None
+    # Days are floored in the formula, so allow one extra day
+    return -HALF_LIFE_DAYS * float(np.log2(needed)) + 1.0
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+from sqlalchemy import literal_column
+
+# Word n-grams hashed into the fingerprint
+SHINGLE_SIZE = 3
+# Texts with fewer distinct shingles get no fingerprint (too short to compare)
+MIN_SHINGLES = 8
+# Fingerprints at most this many bits apart are near-duplicates
+MAX_DISTANCE = 3
+# 64 bits in MAX_DISTANCE + 1 bands: two fingerprints within MAX_DISTANCE bits
+# differ in at most MAX_DISTANCE bands, so they agree exactly on at least one
+BANDS = MAX_DISTANCE + 1
+BAND_BITS = 64 // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_BIT_SHIFTS = np.arange(64, dtype=np.uint64)
+
+
+def _signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def simhash(text: str | None) -> int | None:
+    """64-bit SimHash of a text's word shingles, as a signed int (fits a bigint).
+
+    Every distinct shingle votes on each bit with its blake2b hash; the bit is set
+    when most shingles have it. Similar texts share most shingles and so end up
+    a few bits apart.
+    """
+    if not text:
+        return None
+    words = _WORD_RE.findall(text.lower())
+    shingles = {
+        " ".join(words[i : i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    hashes = np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big"
+            )
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    votes = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).sum(axis=0)
+    value = 0
+    for bit in np.flatnonzero(votes * 2 > len(shingles)).tolist():
+        value |= 1 << bit
+    return _signed(value)
+
+
+def hamming(a: int, b: int) -> int:
+    return ((a ^ b) & ((1 << 64) - 1)).bit_count()
+
+
+def bands(fingerprint: int) -> list[int]:
+    """The fingerprint's LSH band keys (same values as ``band_sql`` computes)."""
+    return [(fingerprint >> (i * BAND_BITS)) & BAND_MASK for i in range(BANDS)]
+
+
+def band_sql(column: Any) -> list[Any]:
+    """``bands`` as SQL expressions over a bigint column, matching the expression
+    indexes of migration c5f2a8e3c001 (hence literals, not bind parameters)."""
+    return [
+        column.op(">>")(literal_column(str(i * BAND_BITS))).op("&")(
+            literal_column(str(BAND_MASK))
+        )
+        for i in range(BANDS)
+    ]
+
+
+class SimHashIndex:
+    """In-memory banded LSH index over SimHash fingerprints.
+
+    A lookup only compares against fingerprints sharing a band key with the query,
+    so near-duplicates are found in constant time on average.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[dict[int, list[tuple[int, Hashable]]]] = [
+            defaultdict(list) for _ in range(BANDS)
+        ]
+
+    def near(
+        self, fingerprint: int, max_distance: int = MAX_DISTANCE
+    ) -> Hashable | None:
+        """Key of an indexed fingerprint within ``max_distance`` bits, if any."""
+        for bucket, key in zip(self._buckets, bands(fingerprint), strict=True):
+            for other, item in bucket.get(key, ()):
+                if hamming(fingerprint, other) <= max_distance:
+                    return item
+        return None
+
+    def add(self, fingerprint: int, item: Hashable) -> None:
+        for bucket, key in zip(self._buckets, bands(fingerprint), strict=True):
+            bucket[key].append((fingerprint, item))
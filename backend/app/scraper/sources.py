@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from sqlmodel import Session, select
+
+from app.core.cache import Generation
+from app.core.config import settings
+from app.models import Source
+
+from .scoring import DEFAULT_SOURCE_WEIGHT
+
+
+@dataclass(frozen=True)
+class SourceConfig:
+    company: str
+    homepage: str
+    weight: float = DEFAULT_SOURCE_WEIGHT
+    enabled: bool = True
+
+
+def _load_from_db() -> list[SourceConfig]:
+    from app.core.db import engine
+
+    with Session(engine) as session:
+        return [
+            SourceConfig(
+                company=s.company,
+                homepage=s.homepage,
+                weight=s.weight,
+                enabled=s.enabled,
+            )
+            for s in session.exec(select(Source))
+        ]
+
+
+class SourceRegistry:
+    """In-process snapshot of the ``source`` table, so lookups are dict reads.
+
+    Writes through the API bump ``generation`` and the next lookup reloads; changes
+    made by other processes are picked up once the snapshot is ``ttl`` seconds old.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[SourceConfig]] = _load_from_db,
+        ttl: float = 60,
+    ) -> None:
+        self.loader = loader
+        self.ttl = ttl
+        self.generation = Generation()
+        self._snapshot: dict[str, SourceConfig] = {}
+        self._version = -1
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self.generation.bump()
+
+    def snapshot(self) -> dict[str, SourceConfig]:
+        if (
+            self._version != self.generation.value
+            or time.monotonic() - self._loaded_at > self.ttl
+        ):
+            with self._lock:
+                # Re-check: another thread may have reloaded while we waited
+                version = self.generation.value
+                if (
+                    self._version != version
+                    or time.monotonic() - self._loaded_at > self.ttl
+                ):
+                    self._snapshot = {s.company: s for s in self.loader()}
+                    self._version = version
+                    self._loaded_at = time.monotonic()
+        return self._snapshot
+
+    def get(self, company: str) -> SourceConfig | None:
+        snapshot = self.snapshot()
+        return snapshot.get(company) or snapshot.get(company.lower())
+
+    def weight(self, company: str) -> float:
+        source = self.get(company)
+        return source.weight if source else DEFAULT_SOURCE_WEIGHT
+
+    def weights(self) -> dict[str, float]:
+        return {company: s.weight for company, s in self.snapshot().items()}
+
+    def enabled_companies(self) -> list[str]:
+        return [company for company, s in self.snapshot().items() if s.enabled]
+
+
+sources = SourceRegistry(ttl=settings.SOURCES_CACHE_TTL_SECONDS)
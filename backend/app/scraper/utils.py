@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from typing import Iterable
+from urllib.parse import urljoin
 
 import httpx
 
 USER_AGENT = "Mozilla/5.0 (compatible; scraperbot/1.0; +https://example.com/bot)"
 
+# Conventional feed locations probed on every homepage
+CONVENTIONAL_FEED_PATHS = ("/feed", "/rss", "/atom.xml", "/index.xml", "/blog/rss", "/blog/atom.xml")
+
 
 def fetch_text(url: str, timeout: float = 15.0) -> str | None:
     try:
@@ -18,11 +23,39 @@ def fetch_text(url: str, timeout: float = 15.0) -> str | None:
         return None
 
 
+def make_async_client(timeout: float = 15.0, max_connections: int = 20) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
+
+async def fetch_text_async(client: httpx.AsyncClient, url: str) -> str | None:
+    try:
+        resp = await client.get(url)
+        if resp.status_code >= 400:
+            return None
+        return resp.text
+    except Exception:
+        return None
+
+
+def content_fingerprint(title: str | None, content: str | None) -> str:
+    # Must match app.models.CONTENT_FP_SQL (the stored scrapedpost.content_fp column)
+    return hashlib.md5(((title or "") + (content or "")).encode("utf-8")).hexdigest()
+
+
 RSS_LINK_RE = re.compile(r'<link[^>]+type=["\']application/(?:rss|atom)\+xml["\'][^>]*>', re.I)
 HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 
 
-def discover_rss_links(html: str, base_url: str) -> list[str]:
+def conventional_feed_links(base_url: str) -> list[str]:
+    return [urljoin(base_url, path) for path in CONVENTIONAL_FEED_PATHS]
+
+
+def discover_rss_links(html: str, base_url: str, include_conventional: bool = True) -> list[str]:
     links: list[str] = []
     for tag in RSS_LINK_RE.findall(html):
         href_match = HREF_RE.search(tag)
@@ -32,14 +65,9 @@ def discover_rss_links(html: str, base_url: str) -> list[str]:
                 links.append(href)
             elif href.startswith("/"):
                 # Resolve simple root-relative
-                from urllib.parse import urljoin
-
                 links.append(urljoin(base_url, href))
-    # Common conventional feeds
-    for path in ("/feed", "/rss", "/atom.xml", "/index.xml", "/blog/rss", "/blog/atom.xml"):
-        from urllib.parse import urljoin
-
-        links.append(urljoin(base_url, path))
+    if include_conventional:
+        links.extend(conventional_feed_links(base_url))
     # Deduplicate
     seen: set[str] = set()
     uniq: list[str] = []
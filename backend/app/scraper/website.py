@@ -1,55 +1,171 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 from urllib.parse import urljoin
 from xml.etree import ElementTree as ET
 
-from .rss import fetch_feed_entries
-from .scoring import score_post
-from .utils import discover_rss_links, fetch_text
+import httpx
+
+from .rss import FeedStreamParser, fetch_feed_async
+from .scoring import DEFAULT_SOURCE_WEIGHT, score_post
+from .simhash import simhash
+from .utils import (
+    conventional_feed_links,
+    discover_rss_links,
+    fetch_text,
+    fetch_text_async,
+)
+
+SITEMAP_PATHS = ("/sitemap.xml", "/sitemap_index.xml", "/sitemap-index.xml")
+
+
+def parse_sitemap_urls(xml: str, max_urls: int = 500) -> list[str]:
+    try:
+        root = ET.fromstring(xml)
+    except ET.ParseError:
+        return []
+    urls: list[str] = []
+    for loc in root.iter():
+        if loc.tag.endswith("loc") and loc.text:
+            u = loc.text.strip()
+            if u.startswith("http"):
+                urls.append(u)
+                if len(urls) >= max_urls:
+                    break
+    return urls
 
 
 def iter_sitemap_urls(homepage: str, max_urls: int = 500) -> list[str]:
-    sitemap_candidates = [
-        urljoin(homepage, "/sitemap.xml"),
-        urljoin(homepage, "/sitemap_index.xml"),
-        urljoin(homepage, "/sitemap-index.xml"),
-    ]
     urls: list[str] = []
-    for sm in sitemap_candidates:
+    for sm in (urljoin(homepage, path) for path in SITEMAP_PATHS):
         xml = fetch_text(sm)
         if not xml:
             continue
-        try:
-            root = ET.fromstring(xml)
-        except ET.ParseError:
-            continue
-        for loc in root.iter():
-            if loc.tag.endswith("loc") and loc.text:
-                u = loc.text.strip()
-                if u.startswith("http"):
-                    urls.append(u)
-                    if len(urls) >= max_urls:
-                        return urls
+        urls.extend(parse_sitemap_urls(xml, max_urls=max_urls - len(urls)))
+        if len(urls) >= max_urls:
+            break
     return urls
 
 
-def scrape_homepage_sources(homepage: str) -> list[dict[str, Any]]:
-    html = fetch_text(homepage)
-    entries: list[dict[str, Any]] = []
+@dataclass
+class Discovery:
+    """Entries collected for a homepage plus which candidate URLs produced them."""
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    feeds: list[str] = field(default_factory=list)
+    sitemaps: list[str] = field(default_factory=list)
+    dead: list[str] = field(default_factory=list)
+    # Every entry URL read, including those left out as already stored
+    urls: list[str] = field(default_factory=list)
+
+
+async def _collect_feeds(
+    client: httpx.AsyncClient,
+    feed_urls: list[str],
+    discovery: Discovery,
+    seen: set[str],
+    known: Mapping[str, str],
+) -> None:
+    async def fetch(url: str) -> tuple[str, FeedStreamParser | None]:
+        return url, await fetch_feed_async(client, url, known=known)
+
+    for done in asyncio.as_completed([fetch(url) for url in feed_urls]):
+        url, parsed = await done
+        # A live feed may legitimately yield nothing new; only non-feeds are dead
+        if parsed is None or not (parsed.is_feed or parsed.items):
+            discovery.dead.append(url)
+            continue
+        discovery.feeds.append(url)
+        discovery.urls.extend(parsed.urls)
+        for e in parsed.items:
+            if e["url"] not in seen:
+                seen.add(e["url"])
+                discovery.entries.append(e)
+
+
+async def _collect_sitemaps(
+    client: httpx.AsyncClient,
+    sitemap_urls: list[str],
+    discovery: Discovery,
+    known: Mapping[str, str],
+    max_urls: int = 500,
+) -> None:
+    documents = await asyncio.gather(*(fetch_text_async(client, sm) for sm in sitemap_urls))
+    urls: list[str] = []
+    # Keep candidate order so results match the serial lookup
+    for sm, xml in zip(sitemap_urls, documents, strict=True):
+        found = parse_sitemap_urls(xml, max_urls=max_urls - len(urls)) if xml else []
+        if not found:
+            discovery.dead.append(sm)
+            continue
+        discovery.sitemaps.append(sm)
+        urls.extend(found)
+        if len(urls) >= max_urls:
+            break
+    discovery.urls.extend(urls)
+    for u in urls:
+        if u in known:
+            continue
+        discovery.entries.append({"title": None, "url": u, "content": None, "published_at": None})
+
+
+async def scrape_homepage_sources_async(
+    homepage: str,
+    client: httpx.AsyncClient,
+    skip: Collection[str] = (),
+    known: Mapping[str, str] | None = None,
+) -> Discovery:
+    """Discover feeds for ``homepage`` and collect their entries with concurrent requests.
+
+    The homepage and the conventional feed paths are requested at once; feeds linked
+    from the homepage are started as soon as it arrives. Entries are merged in arrival
+    order and deduplicated by URL. Sitemaps are only probed (concurrently) when no live
+    feed was found. Candidates in ``skip`` (known dead) are not requested, and entries
+    already stored unchanged (``known``, see ``FeedStreamParser``) are left out.
+    """
+    known = known or {}
+    discovery = Discovery()
+    seen: set[str] = set()
+    conventional = [u for u in conventional_feed_links(homepage) if u not in skip]
+    conventional_task = asyncio.ensure_future(_collect_feeds(client, conventional, discovery, seen, known))
+    html = await fetch_text_async(client, homepage)
+    linked: list[str] = []
     if html:
-        for feed in discover_rss_links(html, homepage):
-            for e in fetch_feed_entries(feed):
-                entries.append(e)
+        linked = [
+            u
+            for u in discover_rss_links(html, homepage, include_conventional=False)
+            if u not in skip and u not in conventional
+        ]
+    await asyncio.gather(conventional_task, _collect_feeds(client, linked, discovery, seen, known))
     # Fallback: try sitemaps but without full article parsing, keep URLs as posts
-    if not entries:
-        for u in iter_sitemap_urls(homepage):
-            entries.append({"title": None, "url": u, "content": None, "published_at": None})
-    return entries
+    if not discovery.feeds:
+        candidates = [u for u in (urljoin(homepage, path) for path in SITEMAP_PATHS) if u not in skip]
+        await _collect_sitemaps(client, candidates, discovery, known)
+    return discovery
+
+
+async def scrape_known_sources_async(
+    client: httpx.AsyncClient,
+    feeds: list[str],
+    sitemaps: list[str],
+    known: Mapping[str, str] | None = None,
+) -> Discovery:
+    """Collect entries from previously discovered feeds/sitemaps only, skipping discovery."""
+    known = known or {}
+    discovery = Discovery()
+    await _collect_feeds(client, feeds, discovery, set(), known)
+    if not discovery.feeds and sitemaps:
+        await _collect_sitemaps(client, sitemaps, discovery, known)
+    return discovery
 
 
-def normalize_entries(company: str, platform: str, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def normalize_entries(
+    company: str, platform: str, entries: list[dict[str, Any]], source_weight: float = DEFAULT_SOURCE_WEIGHT
+) -> list[dict[str, Any]]:
     norm: list[dict[str, Any]] = []
     for e in entries:
         title = e.get("title")
@@ -57,8 +173,10 @@ def normalize_entries(company: str, platform: str, entries: list[dict[str, Any]]
         url = e.get("url")
         published_at = e.get("published_at")
         score = score_post(
-            published_at=published_at, content_length=(len(content) if content else 0), source_weight=1.2
+            published_at=published_at, content_length=(len(content) if content else 0), source_weight=source_weight
         )
+        # Title and content, so reposts under other URLs fingerprint the same
+        fingerprint = simhash(" ".join(part for part in (title, content) if part))
         norm.append(
             {
                 "company": company,
@@ -68,6 +186,7 @@ def normalize_entries(company: str, platform: str, entries: list[dict[str, Any]]
                 "content": content,
                 "published_at": published_at,
                 "score": score,
+                "simhash": fingerprint,
             }
         )
     return norm
@@ -79,6 +79,26 @@ def test_read_items(
     assert len(content["data"]) >= 2
 
 
+def test_read_items_conditional(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    create_random_item(db)
+    url = f"{settings.API_V1_STR}/items/"
+    response = client.get(url, headers=superuser_token_headers)
+    etag = response.headers["ETag"]
+    response = client.get(
+        url, headers={**superuser_token_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    create_random_item(db)
+    response = client.get(
+        url, headers={**superuser_token_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
 def test_update_item(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -1,7 +1,15 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
 from fastapi.testclient import TestClient
+from sqlmodel import Session, select
 
 from app.main import app
-
+from app.models import CrawlChange, CrawlLink, CrawlPage, CrawlRun, ScrapeJob
+from app.scraper.changes import finish_run, start_run
+from app.scraper.runner import upsert_post
+from app.scraper.website import normalize_entries
 
 client = TestClient(app)
 
@@ -18,3 +26,312 @@ def test_run_scraper_requires_auth():
     r = client.post("/api/v1/scraper/run/", params={"companies": ["laudite"]})
     # Should require superuser auth
     assert r.status_code in (401, 403)
+
+
+def test_list_posts_cache_invalidated_by_upsert(db: Session) -> None:
+    params = {"company": f"cache-{uuid.uuid4().hex[:8]}"}
+    before = client.get("/api/v1/scraper/posts/", params=params).json()
+    assert client.get("/api/v1/scraper/posts/", params=params).json() == before
+    upsert_post(
+        db,
+        {
+            "company": params["company"],
+            "platform": "rss",
+            "url": f"https://example.com/{uuid.uuid4()}",
+        },
+    )
+    after = client.get("/api/v1/scraper/posts/", params=params).json()
+    assert after["count"] == before["count"] + 1
+
+
+def test_list_posts_collapse_near_duplicates(db: Session) -> None:
+    company = f"dup-{uuid.uuid4().hex[:8]}"
+    content = " ".join(
+        f"{company} sentence number {i} about radiology reports" for i in range(20)
+    )
+    for _ in range(2):
+        entry = normalize_entries(
+            company=company,
+            platform="rss",
+            entries=[
+                {
+                    "url": f"https://example.com/{uuid.uuid4()}",
+                    "title": "Same post",
+                    "content": content,
+                }
+            ],
+        )[0]
+        upsert_post(db, entry)
+    params = {"company": company}
+    assert client.get("/api/v1/scraper/posts/", params=params).json()["count"] == 2
+    collapsed = client.get(
+        "/api/v1/scraper/posts/", params={**params, "collapse": True}
+    ).json()
+    assert collapsed["count"] == 1
+
+
+def _word() -> str:
+    """A made-up word, so searches only match rows of the calling test."""
+    return "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:12])
+
+
+def _post(db: Session, company: str, content: str, language: str | None = None) -> str:
+    url = f"https://example.com/{uuid.uuid4()}"
+    upsert_post(
+        db,
+        {
+            "company": company,
+            "platform": "rss",
+            "url": url,
+            "content": content,
+            "language": language,
+        },
+    )
+    return url
+
+
+def test_search_posts_stems_with_language_config(db: Session) -> None:
+    company = f"search-{uuid.uuid4().hex[:8]}"
+    english = _post(
+        db,
+        company,
+        "Radiologists are reporting results faster than ever",
+        language="en",
+    )
+    # Posts without a language are only indexed with "simple": no stemming
+    _post(db, company, "Radiologists are reporting results faster than ever")
+    params = {"q": "report", "company": company, "language": "en"}
+    hits = client.get("/api/v1/scraper/posts/search", params=params).json()["data"]
+    assert [h["url"] for h in hits] == [english]
+    assert "<mark>reporting</mark>" in hits[0]["snippet"]
+
+
+def test_search_posts_simple_token_match(db: Session) -> None:
+    company = f"search-{uuid.uuid4().hex[:8]}"
+    word = _word()
+    _post(db, company, f"Release notes mention {word} twice: {word}")
+    r = client.get("/api/v1/scraper/posts/search", params={"q": word})
+    assert r.status_code == 200
+    hits = r.json()["data"]
+    assert [h["company"] for h in hits] == [company]
+    assert f"<mark>{word}</mark>" in hits[0]["snippet"]
+    assert hits[0]["rank"] > 0
+
+
+def test_search_posts_cursor_continues_without_overlap(db: Session) -> None:
+    company = f"search-{uuid.uuid4().hex[:8]}"
+    word = _word()
+    for i in range(3):
+        _post(db, company, " ".join([word] * (i + 1)))
+    params = {"q": word, "limit": 2}
+    first = client.get("/api/v1/scraper/posts/search", params=params).json()
+    assert len(first["data"]) == 2
+    assert first["next_cursor"]
+    second = client.get(
+        "/api/v1/scraper/posts/search",
+        params={**params, "cursor": first["next_cursor"]},
+    ).json()
+    assert len(second["data"]) == 1
+    assert second["next_cursor"] is None
+    hits = first["data"] + second["data"]
+    assert len({h["id"] for h in hits}) == 3
+    ranks = [h["rank"] for h in hits]
+    assert ranks == sorted(ranks, reverse=True)
+
+
+def test_search_pages_by_job(
+    db: Session, superuser_token_headers: dict[str, str]
+) -> None:
+    word = _word()
+    jobs = [ScrapeJob(name="search"), ScrapeJob(name="search")]
+    db.add_all(jobs)
+    db.commit()
+    for job in jobs:
+        for i in range(2):
+            url = f"https://example.com/{uuid.uuid4()}"
+            db.add(
+                CrawlPage(
+                    job_id=job.id,
+                    url=url,
+                    normalized_url=url,
+                    title=f"Page {i}",
+                    content_text=f"About {word}",
+                )
+            )
+    db.commit()
+    params = {"q": word, "job_id": str(jobs[0].id), "limit": 1}
+    first = client.get(
+        "/api/v1/scraper/pages/search", params=params, headers=superuser_token_headers
+    ).json()
+    assert len(first["data"]) == 1
+    assert f"<mark>{word}</mark>" in first["data"][0]["snippet"]
+    second = client.get(
+        "/api/v1/scraper/pages/search",
+        params={**params, "cursor": first["next_cursor"]},
+        headers=superuser_token_headers,
+    ).json()
+    hits = first["data"] + second["data"]
+    assert {h["job_id"] for h in hits} == {str(jobs[0].id)}
+    assert len({h["id"] for h in hits}) == 2
+
+
+def test_search_pages_requires_auth() -> None:
+    r = client.get("/api/v1/scraper/pages/search", params={"q": "anything"})
+    assert r.status_code in (401, 403)
+
+
+def _job_with_pages(db: Session) -> tuple[ScrapeJob, list[CrawlPage]]:
+    job = ScrapeJob(name="pages")
+    db.add(job)
+    db.commit()
+    fetched = datetime(2025, 8, 1, tzinfo=timezone.utc)
+    pages = []
+    for i in range(9):
+        url = f"https://example.com/{i}"
+        # Pages sharing a depth and fetch time are ordered by id
+        pages.append(
+            CrawlPage(
+                job_id=job.id,
+                url=url,
+                normalized_url=url,
+                depth=i % 3,
+                status_code=404 if i % 4 == 0 else 200,
+                fetched_at=fetched + timedelta(seconds=i // 2),
+            )
+        )
+    db.add_all(pages)
+    db.commit()
+    return job, sorted(pages, key=lambda p: (p.depth, p.fetched_at, p.id))
+
+
+def _page_through(job: ScrapeJob, headers: dict[str, str], **params: Any) -> list[str]:
+    ids: list[str] = []
+    cursor = None
+    while True:
+        r = client.get(
+            f"/api/v1/scraper/jobs/{job.id}/pages",
+            params={**params, "limit": 2, **({"cursor": cursor} if cursor else {})},
+            headers=headers,
+        )
+        assert r.status_code == 200
+        body = r.json()
+        ids.extend(p["id"] for p in body["data"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def test_job_pages_cursor_pagination(
+    db: Session, superuser_token_headers: dict[str, str]
+) -> None:
+    job, pages = _job_with_pages(db)
+    assert _page_through(job, superuser_token_headers) == [str(p.id) for p in pages]
+    assert _page_through(job, superuser_token_headers, depth=1) == [
+        str(p.id) for p in pages if p.depth == 1
+    ]
+    assert _page_through(job, superuser_token_headers, status_code=404) == [
+        str(p.id) for p in pages if p.status_code == 404
+    ]
+
+
+def test_job_pages_invalid_cursor(superuser_token_headers: dict[str, str]) -> None:
+    r = client.get(
+        f"/api/v1/scraper/jobs/{uuid.uuid4()}/pages",
+        params={"cursor": "not-a-cursor"},
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 400
+
+
+def test_list_posts_summary_view(db: Session) -> None:
+    company = f"view-{uuid.uuid4().hex[:8]}"
+    url = f"https://example.com/{uuid.uuid4()}"
+    upsert_post(
+        db,
+        {
+            "company": company,
+            "platform": "rss",
+            "url": url,
+            "content": "Body",
+            "metadata": {"k": "v"},
+        },
+    )
+    full = client.get("/api/v1/scraper/posts/", params={"company": company}).json()
+    assert full["view"] == "full"
+    assert full["data"][0]["content"] == "Body"
+    assert full["data"][0]["metadata"] == {"k": "v"}
+    summary = client.get(
+        "/api/v1/scraper/posts/", params={"company": company, "view": "summary"}
+    ).json()
+    assert summary["view"] == "summary"
+    assert summary["data"][0]["url"] == url
+    assert "content" not in summary["data"][0]
+    assert "metadata" not in summary["data"][0]
+
+
+def test_list_job_pages_summary_view(
+    db: Session, superuser_token_headers: dict[str, str]
+) -> None:
+    job, _ = _job_with_pages(db)
+    path = f"/api/v1/scraper/jobs/{job.id}/pages"
+    full = client.get(path, params={"limit": 1}, headers=superuser_token_headers).json()
+    assert full["view"] == "full"
+    assert "content_text" in full["data"][0]
+    summary = client.get(
+        path, params={"limit": 1, "view": "summary"}, headers=superuser_token_headers
+    ).json()
+    assert summary["view"] == "summary"
+    assert "content_text" not in summary["data"][0]
+    assert "meta" not in summary["data"][0]
+
+
+def test_edited_post_becomes_near_duplicate(db: Session) -> None:
+    company = f"dup-{uuid.uuid4().hex[:8]}"
+    url = f"https://example.com/{uuid.uuid4()}"
+    texts = [
+        " ".join(
+            f"{company} release notes paragraph {i} about radiology reports"
+            for i in range(20)
+        ),
+        " ".join(
+            f"{company} billing changes for customers in region {i} start next month"
+            for i in range(20)
+        ),
+    ]
+    for post_url, text in (
+        (f"https://example.com/{uuid.uuid4()}", texts[0]),
+        (url, texts[1]),
+    ):
+        entry = normalize_entries(
+            company=company,
+            platform="rss",
+            entries=[{"url": post_url, "content": text}],
+        )[0]
+        upsert_post(db, entry)
+    params = {"company": company, "collapse": True}
+    assert client.get("/api/v1/scraper/posts/", params=params).json()["count"] == 2
+    # The second post is edited into a copy of the first
+    entry = normalize_entries(
+        company=company, platform="rss", entries=[{"url": url, "content": texts[0]}]
+    )[0]
+    assert upsert_post(db, entry)
+    assert client.get("/api/v1/scraper/posts/", params=params).json()["count"] == 1
+
+
+def test_delete_job_removes_its_crawl_data(
+    db: Session, superuser_token_headers: dict[str, str]
+) -> None:
+    job, pages = _job_with_pages(db)
+    diff = start_run(db, job.id)
+    diff.record(1, "new", pages[0].id)
+    finish_run(db, diff)
+    db.add(CrawlLink(job_id=job.id, source=0, target=1))
+    db.commit()
+    job_id, run_id = job.id, diff.run.id
+    r = client.delete(f"/api/v1/scraper/jobs/{job_id}", headers=superuser_token_headers)
+    assert r.status_code == 200
+    db.expunge_all()
+    assert db.exec(select(CrawlPage).where(CrawlPage.job_id == job_id)).all() == []
+    assert db.exec(select(CrawlRun).where(CrawlRun.job_id == job_id)).all() == []
+    assert db.exec(select(CrawlChange).where(CrawlChange.run_id == run_id)).all() == []
+    assert db.exec(select(CrawlLink).where(CrawlLink.job_id == job_id)).all() == []
@@ -0,0 +1,134 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import sources as sources_routes
+from app.core.config import settings
+
+
+@pytest.fixture
+def rescored(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Companies whose rescoring the routes scheduled (run after each response)."""
+    calls: list[str] = []
+    monkeypatch.setattr(sources_routes, "rescore_blocking", calls.append)
+    return calls
+
+
+def _company() -> str:
+    return f"source-{uuid.uuid4().hex[:8]}"
+
+
+def test_create_source(
+    client: TestClient, superuser_token_headers: dict[str, str], rescored: list[str]
+) -> None:
+    company = _company()
+    data = {"company": company, "homepage": "https://example.com/"}
+    r = client.post(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers, json=data
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert content["company"] == company
+    assert content["weight"] == 1.2
+    assert content["enabled"] is True
+    # Default weight: stored posts are already scored with it
+    assert rescored == []
+    listed = client.get(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers
+    ).json()
+    assert company in [s["company"] for s in listed["data"]]
+
+
+def test_create_source_with_weight_rescores(
+    client: TestClient, superuser_token_headers: dict[str, str], rescored: list[str]
+) -> None:
+    company = _company()
+    data = {"company": company, "homepage": "https://example.com/", "weight": 2.0}
+    r = client.post(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers, json=data
+    )
+    assert r.status_code == 200
+    assert rescored == [company]
+
+
+def test_create_duplicate_source(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    data = {"company": _company(), "homepage": "https://example.com/"}
+    r = client.post(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers, json=data
+    )
+    assert r.status_code == 200
+    r = client.post(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers, json=data
+    )
+    assert r.status_code == 409
+    assert r.json()["detail"] == "Source already exists"
+
+
+def test_update_source(
+    client: TestClient, superuser_token_headers: dict[str, str], rescored: list[str]
+) -> None:
+    company = _company()
+    data = {"company": company, "homepage": "https://example.com/"}
+    client.post(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers, json=data
+    )
+    r = client.patch(
+        f"{settings.API_V1_STR}/sources/{company}",
+        headers=superuser_token_headers,
+        json={"homepage": "https://example.org/"},
+    )
+    assert r.status_code == 200
+    assert r.json()["homepage"] == "https://example.org/"
+    assert rescored == []
+    r = client.patch(
+        f"{settings.API_V1_STR}/sources/{company}",
+        headers=superuser_token_headers,
+        json={"weight": 0.5},
+    )
+    assert r.status_code == 200
+    assert r.json()["weight"] == 0.5
+    # A weight change rescores that company's posts
+    assert rescored == [company]
+
+
+def test_update_source_not_found(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.patch(
+        f"{settings.API_V1_STR}/sources/{_company()}",
+        headers=superuser_token_headers,
+        json={"weight": 2.0},
+    )
+    assert r.status_code == 404
+
+
+def test_delete_source(
+    client: TestClient, superuser_token_headers: dict[str, str], rescored: list[str]
+) -> None:
+    company = _company()
+    data = {"company": company, "homepage": "https://example.com/", "weight": 3.0}
+    client.post(
+        f"{settings.API_V1_STR}/sources/", headers=superuser_token_headers, json=data
+    )
+    rescored.clear()
+    r = client.delete(
+        f"{settings.API_V1_STR}/sources/{company}", headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    assert r.json()["message"] == "Source deleted"
+    # Its posts fall back to the default weight
+    assert rescored == [company]
+    r = client.delete(
+        f"{settings.API_V1_STR}/sources/{company}", headers=superuser_token_headers
+    )
+    assert r.status_code == 404
+
+
+def test_sources_require_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(f"{settings.API_V1_STR}/sources/", headers=normal_user_token_headers)
+    assert r.status_code == 403
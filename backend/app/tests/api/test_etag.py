@@ -0,0 +1,24 @@
+from starlette.requests import Request
+
+from app.api.etag import body_etag, etag_matches, make_etag
+
+
+def _request(if_none_match: str | None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_make_etag_is_stable_and_quoted() -> None:
+    etag = make_etag("job", 1, None)
+    assert etag == make_etag("job", 1, None)
+    assert etag != make_etag("job", 2, None)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert body_etag(b"{}") != body_etag(b"[]")
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard() -> None:
+    etag = make_etag("x")
+    assert etag_matches(_request(f'"other", W/{etag}'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request('"other"'), etag)
+    assert not etag_matches(_request(None), etag)
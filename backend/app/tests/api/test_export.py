@@ -0,0 +1,153 @@
+import csv
+import gzip
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    create_engine,
+    insert,
+    select,
+)
+
+from app.api.export import (
+    csv_chunks,
+    gzip_chunks,
+    iter_row_batches,
+    ndjson_chunks,
+    write_parquet,
+)
+
+ROW_ID = uuid.uuid4()
+FETCHED = datetime(2025, 8, 1, 12, 30, tzinfo=timezone.utc)
+COLUMNS = ["id", "title", "fetched_at", "meta"]
+BATCHES = [
+    [(ROW_ID, 'Say "hi", then\nleave', FETCHED, {"tags": ["a", "b"]})],
+    [(ROW_ID, "Olá", None, None), (ROW_ID, "", FETCHED, [])],
+]
+
+metadata = MetaData()
+rows_table = Table(
+    "rows",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("title", String),
+    Column("fetched_at", DateTime(timezone=True)),
+    Column("meta", JSON),
+    Column("ref", Uuid),
+)
+
+
+def _engine(tmp_path: Path, count: int) -> Engine:
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    metadata.create_all(engine)
+    if count:
+        with engine.begin() as conn:
+            conn.execute(
+                insert(rows_table),
+                [
+                    {
+                        "id": i,
+                        "title": f"Row {i}",
+                        "fetched_at": FETCHED,
+                        "meta": {"i": i},
+                        "ref": ROW_ID,
+                    }
+                    for i in range(count)
+                ],
+            )
+    return engine
+
+
+def test_ndjson_chunks_one_object_per_row() -> None:
+    chunks = list(ndjson_chunks(COLUMNS, BATCHES))
+    assert len(chunks) == len(BATCHES)
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            "id": str(ROW_ID),
+            "title": 'Say "hi", then\nleave',
+            "fetched_at": FETCHED.isoformat(),
+            "meta": {"tags": ["a", "b"]},
+        },
+        {"id": str(ROW_ID), "title": "Olá", "fetched_at": None, "meta": None},
+        {"id": str(ROW_ID), "title": "", "fetched_at": FETCHED.isoformat(), "meta": []},
+    ]
+    # Non-ASCII text is written as is, not escaped
+    assert "Olá".encode() in chunks[1]
+
+
+def test_csv_chunks_header_and_quoting() -> None:
+    chunks = list(csv_chunks(COLUMNS, BATCHES))
+    # The header goes out with the first batch
+    assert len(chunks) == len(BATCHES)
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows == [
+        COLUMNS,
+        [
+            str(ROW_ID),
+            'Say "hi", then\nleave',
+            FETCHED.isoformat(),
+            '{"tags": ["a", "b"]}',
+        ],
+        [str(ROW_ID), "Olá", "", ""],
+        [str(ROW_ID), "", FETCHED.isoformat(), "[]"],
+    ]
+
+
+def test_csv_chunks_header_only_without_rows() -> None:
+    assert b"".join(csv_chunks(COLUMNS, [])) == b"id,title,fetched_at,meta\r\n"
+
+
+def test_gzip_chunks_decompress_to_the_same_bytes() -> None:
+    chunks = [b"", b"first line\n", bytes(range(256)) * 100, b"last\n"]
+    compressed = list(gzip_chunks(iter(chunks)))
+    assert gzip.decompress(b"".join(compressed)) == b"".join(chunks)
+    # The container is finished even when nothing was written
+    assert gzip.decompress(b"".join(gzip_chunks([]))) == b""
+
+
+def test_iter_row_batches_yields_partitions(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, 5)
+    statement = select(rows_table.c.id, rows_table.c.title).order_by(rows_table.c.id)
+    batches = [list(batch) for batch in iter_row_batches(statement, 2, bind=engine)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [tuple(row) for batch in batches for row in batch] == [
+        (i, f"Row {i}") for i in range(5)
+    ]
+
+
+def test_iter_row_batches_empty_result(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, 0)
+    assert list(iter_row_batches(select(rows_table), 2, bind=engine)) == []
+
+
+def test_write_parquet_round_trip(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    engine = _engine(tmp_path, 5)
+    path = tmp_path / "rows.parquet"
+    assert (
+        write_parquet(select(rows_table).order_by(rows_table.c.id), path, bind=engine)
+        == 5
+    )
+    table = pq.read_table(path)
+    assert table.column_names == ["id", "title", "fetched_at", "meta", "ref"]
+    assert table.to_pylist()[1] == {
+        "id": 1,
+        "title": "Row 1",
+        "fetched_at": FETCHED,
+        "meta": '{"i": 1}',
+        "ref": str(ROW_ID),
+    }
@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.pagination import (
+    cursor_datetime,
+    cursor_uuid,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip() -> None:
+    published = datetime(2025, 8, 1, 12, 30, tzinfo=timezone.utc)
+    post_id = uuid.uuid4()
+    cursor = encode_cursor(published, None, post_id)
+    raw_published, raw_missing, raw_id = decode_cursor(cursor, 3)
+    assert cursor_datetime(raw_published) == published
+    assert cursor_datetime(raw_missing) is None
+    assert cursor_uuid(raw_id) == post_id
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(1, 2)])
+def test_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, 3)
+    assert exc.value.status_code == 400
@@ -0,0 +1,26 @@
+import time
+
+from starlette.requests import Request
+
+from app.api.deps import READ_PRIMARY_COOKIE, reads_primary
+
+
+def _request(headers: dict[str, str]) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_reads_go_to_replica_by_default() -> None:
+    assert not reads_primary(_request({}))
+
+
+def test_header_forces_primary() -> None:
+    assert reads_primary(_request({"X-Read-Primary": "1"}))
+
+
+def test_cookie_pins_primary_until_expiry() -> None:
+    fresh = f"{READ_PRIMARY_COOKIE}={time.time() + 30:.0f}"
+    stale = f"{READ_PRIMARY_COOKIE}={time.time() - 30:.0f}"
+    assert reads_primary(_request({"Cookie": fresh}))
+    assert not reads_primary(_request({"Cookie": stale}))
+    assert not reads_primary(_request({"Cookie": f"{READ_PRIMARY_COOKIE}=garbage"}))
@@ -0,0 +1,48 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from sqlmodel import SQLModel
+
+from app.api.serialize import dump_json
+
+
+class Row(SQLModel):
+    id: uuid.UUID
+    published_at: datetime | None = None
+    meta: dict[str, Any] | None = None
+
+
+class Page(SQLModel):
+    data: list[Row]
+    count: int
+
+
+def test_dump_json_validates_and_encodes_in_one_pass() -> None:
+    row_id = uuid.uuid4()
+    published = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    body = dump_json(
+        Page,
+        {
+            "data": [{"id": row_id, "published_at": published, "meta": {"a": [1]}}],
+            "count": 1,
+        },
+    )
+    assert json.loads(body) == {
+        "data": [
+            {
+                "id": str(row_id),
+                "published_at": "2024-05-01T00:00:00Z",
+                "meta": {"a": [1]},
+            }
+        ],
+        "count": 1,
+    }
+
+
+def test_dump_json_rejects_invalid_rows() -> None:
+    with pytest.raises(ValidationError):
+        dump_json(Page, {"data": [{"id": "not-a-uuid"}], "count": 1})
@@ -0,0 +1,29 @@
+import time
+
+from app.core.cache import Generation, TTLCache
+
+
+def test_ttl_cache_expires_entries() -> None:
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=0.01)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_generation_bump_changes_value() -> None:
+    generation = Generation()
+    start = generation.value
+    assert generation.bump() == start + 1
+    assert generation.value == start + 1
@@ -0,0 +1,37 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine, exc
+
+from app.core.pool import InstrumentedQueuePool, pool_stats, warm_up
+
+
+def _engine(tmp_path: Path, **kwargs: Any) -> Engine:
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, **kwargs
+    )
+
+
+def test_checkouts_and_timeouts_are_recorded(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    with engine.connect():
+        stats = pool_stats(engine.pool)
+        assert stats["checked_out"] == 1
+        assert stats["saturation"] == 1.0
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    stats = pool_stats(engine.pool)
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_max_ms"] >= 50
+    assert stats["checked_out"] == 0
+
+
+def test_warm_up_fills_the_pool(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, pool_size=3, max_overflow=2)
+    warm_up(engine, 3)
+    stats = pool_stats(engine.pool)
+    assert stats["checked_in"] == 3
+    assert stats["checked_out"] == 0
+    assert stats["saturation"] == 0.0
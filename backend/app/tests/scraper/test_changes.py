@@ -0,0 +1,55 @@
+import uuid
+
+from app.models import CrawlRun
+from app.scraper.changes import (
+    CHANGED,
+    NEW,
+    REMOVED,
+    UNCHANGED,
+    RunDiff,
+    content_hash,
+    net_changes,
+)
+
+
+def test_content_hash_separates_fields() -> None:
+    assert content_hash(200, "Title", "text") == content_hash(200, "Title", "text")
+    assert content_hash(200, "Title", "text") != content_hash(200, "Titletext", "")
+    assert content_hash(200, "Title", "text") != content_hash(404, "Title", "text")
+
+
+def test_run_diff_classifies_against_previous_run() -> None:
+    kept, edited, gone = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    run = CrawlRun(job_id=uuid.uuid4(), number=2)
+    diff = RunDiff(run, {1: (kept, 10), 2: (edited, 20), 3: (gone, 30)})
+    assert diff.classify(1, 10) == (UNCHANGED, kept)
+    assert diff.classify(2, 21) == (CHANGED, None)
+    assert diff.classify(4, 40) == (NEW, None)
+    diff.record(1, UNCHANGED, kept)
+    diff.record(2, CHANGED, uuid.uuid4())
+    diff.record(4, NEW, uuid.uuid4())
+    diff.close()
+    assert diff.counts == {UNCHANGED: 1, CHANGED: 1, NEW: 1, REMOVED: 1}
+    assert {
+        "run_id": run.id,
+        "url_fp": 3,
+        "kind": REMOVED,
+        "page_id": gone,
+    } in diff.records
+
+
+def test_net_changes_per_url() -> None:
+    a, b, c, d = (uuid.uuid4() for _ in range(4))
+    rows = [
+        (1, 2, NEW, a),
+        (1, 3, CHANGED, b),  # new then changed: still new
+        (2, 2, CHANGED, c),
+        (2, 3, REMOVED, c),  # changed then removed: removed
+        (3, 2, NEW, d),
+        (3, 3, REMOVED, d),  # came and went: not reported
+        (4, 3, CHANGED, b),
+    ]
+    result = {
+        r["url_fp"]: (r["kind"], r["run"], r["page_id"]) for r in net_changes(rows)
+    }
+    assert result == {1: (NEW, 3, b), 2: (REMOVED, 3, c), 4: (CHANGED, 3, b)}
@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import urljoin
+
+import httpx
+
+from app.core.config import settings
+from app.models import FeedDiscovery
+from app.scraper.runner import (
+    _collect_company_entries,
+    _discovery_is_fresh,
+    _save_discovery,
+)
+from app.scraper.utils import conventional_feed_links
+from app.scraper.website import SITEMAP_PATHS, Discovery
+
+NOW = datetime(2025, 8, 1, tzinfo=timezone.utc)
+HOMEPAGE = "https://example.com/"
+DEAD = conventional_feed_links(HOMEPAGE) + [
+    urljoin(HOMEPAGE, path) for path in SITEMAP_PATHS
+]
+STALE = NOW - timedelta(hours=settings.SCRAPER_DISCOVERY_TTL_HOURS + 1)
+
+
+class _Session:
+    def add(self, obj: Any) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+
+def _cached(
+    discovered_at: datetime = NOW - timedelta(hours=1), **fields: Any
+) -> FeedDiscovery:
+    return FeedDiscovery(
+        company="example", homepage=HOMEPAGE, discovered_at=discovered_at, **fields
+    )
+
+
+def _collect(cached: FeedDiscovery) -> tuple[list[str], bool]:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if str(request.url) == HOMEPAGE:
+            return httpx.Response(200, text="<html></html>")
+        return httpx.Response(404)
+
+    async def run() -> bool:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            _, rediscovered = await _collect_company_entries(
+                client, HOMEPAGE, cached, {}, NOW
+            )
+            return rediscovered
+
+    return requested, asyncio.run(run())
+
+
+def test_freshness_depends_on_homepage_and_ttl_only() -> None:
+    cached = _cached()  # no live feed or sitemap
+    assert _discovery_is_fresh(cached, HOMEPAGE, NOW)
+    assert not _discovery_is_fresh(cached, "https://other.example/", NOW)
+    assert not _discovery_is_fresh(_cached(discovered_at=STALE), HOMEPAGE, NOW)
+
+
+def test_fresh_cache_without_feeds_skips_dead_candidates() -> None:
+    requested, rediscovered = _collect(_cached(dead_urls=DEAD))
+    assert rediscovered
+    assert requested == [HOMEPAGE]
+
+
+def test_stale_cache_reprobes_dead_candidates() -> None:
+    requested, rediscovered = _collect(_cached(discovered_at=STALE, dead_urls=DEAD))
+    assert rediscovered
+    assert set(DEAD) <= set(requested)
+
+
+def test_revalidation_keeps_skipped_dead_candidates() -> None:
+    cached = _cached(dead_urls=["https://example.com/old.xml"])
+    discovered_at = cached.discovered_at
+    discovery = Discovery(
+        feeds=["https://example.com/feed"],
+        dead=["https://example.com/rss"],
+        urls=[
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/a",
+        ],
+    )
+    saved = _save_discovery(
+        _Session(),  # type: ignore[arg-type]
+        company="example",
+        homepage=HOMEPAGE,
+        cached=cached,
+        discovery=discovery,
+        rediscovered=True,
+        now=NOW,
+    )
+    assert saved.feeds == ["https://example.com/feed"]
+    # The feed window whose stored posts the next poll looks up
+    assert saved.entry_urls == ["https://example.com/a", "https://example.com/b"]
+    assert saved.dead_urls == ["https://example.com/old.xml", "https://example.com/rss"]
+    # Only a full discovery restarts the TTL
+    assert saved.discovered_at == discovered_at
+    assert saved.validated_at == NOW
+
+
+def test_full_discovery_replaces_dead_candidates() -> None:
+    cached = _cached(
+        discovered_at=STALE,
+        dead_urls=["https://example.com/old.xml", "https://example.com/feed"],
+    )
+    discovery = Discovery(
+        feeds=["https://example.com/feed"], dead=["https://example.com/rss"]
+    )
+    saved = _save_discovery(
+        _Session(),  # type: ignore[arg-type]
+        company="example",
+        homepage=HOMEPAGE,
+        cached=cached,
+        discovery=discovery,
+        rediscovered=True,
+        now=NOW,
+    )
+    # A candidate that answered again is no longer dead
+    assert saved.dead_urls == ["https://example.com/rss"]
+    assert saved.discovered_at == NOW
@@ -0,0 +1,43 @@
+import hashlib
+
+from app.scraper.frontier import BloomFilter, UrlFrontier, url_fingerprint
+
+
+def test_bloom_filter_membership() -> None:
+    bloom = BloomFilter(1000)
+    bloom.add("https://example.com/a")
+    assert "https://example.com/a" in bloom
+    assert "https://example.com/b" not in bloom
+
+
+def test_frontier_deduplicates_at_enqueue() -> None:
+    with UrlFrontier(capacity=100) as frontier:
+        assert frontier.push("https://example.com/", 0)
+        assert not frontier.push("https://example.com/", 1)
+        assert len(frontier) == 1
+        assert frontier.pop() == ("https://example.com/", 0)
+        # Popped URLs stay seen
+        assert not frontier.push("https://example.com/", 2)
+        assert not frontier
+
+
+def test_frontier_spills_to_disk_and_keeps_fifo_order() -> None:
+    with UrlFrontier(capacity=1000, memory_items=10) as frontier:
+        for i in range(100):
+            assert frontier.push(f"https://example.com/{i}", i)
+        assert len(frontier) == 100
+        popped = [frontier.pop()[1] for _ in range(50)]
+        for i in range(100, 130):
+            frontier.push(f"https://example.com/{i}", i)
+            assert not frontier.push(f"https://example.com/{i - 100}", 0)
+        while frontier:
+            popped.append(frontier.pop()[1])
+    assert popped == list(range(130))
+
+
+def test_url_fingerprint_matches_sql_definition() -> None:
+    # ('x' || substr(md5(url), 1, 16))::bit(64)::bigint: leading 16 hex digits, two's complement
+    url = "https://example.com/notícias?page=2"
+    value = int(hashlib.md5(url.encode("utf-8")).hexdigest()[:16], 16)
+    expected = value - (1 << 64) if value >= 1 << 63 else value
+    assert url_fingerprint(url) == expected
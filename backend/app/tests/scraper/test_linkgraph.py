@@ -0,0 +1,33 @@
+import numpy as np
+
+from app.scraper.linkgraph import LinkGraph, pagerank
+
+
+def test_link_graph_assigns_dense_ids_and_dedupes_edges() -> None:
+    graph = LinkGraph()
+    a = graph.node("https://example.com/")
+    b = graph.node("https://example.com/about")
+    assert (a, b) == (0, 1)
+    assert graph.node("https://example.com/") == a
+    graph.add_edge(a, b)
+    graph.add_edge(a, b)
+    graph.add_edge(a, a)  # self-links are ignored
+    sources, targets = graph.edges()
+    assert sources.tolist() == [0]
+    assert targets.tolist() == [1]
+    assert len(graph) == 2
+
+
+def test_pagerank_favors_linked_pages() -> None:
+    # 0 -> 1, 2 -> 1, 1 -> 0; node 3 is dangling (discovered, not fetched)
+    sources = np.array([0, 2, 1, 2], dtype=np.int32)
+    targets = np.array([1, 1, 0, 3], dtype=np.int32)
+    rank = pagerank(sources, targets, 4)
+    assert abs(rank.sum() - 1.0) < 1e-9
+    assert rank.argmax() == 1
+    assert rank[0] > rank[2]
+
+
+def test_pagerank_without_edges_is_uniform() -> None:
+    rank = pagerank(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), 4)
+    assert np.allclose(rank, 0.25)
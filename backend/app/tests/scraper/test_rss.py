@@ -0,0 +1,67 @@
+from app.scraper.rss import FeedStreamParser, parse_feed
+from app.scraper.utils import content_fingerprint
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+{items}
+</channel></rss>"""
+
+ATOM = """<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<entry><title>Hello</title><link href="https://example.com/hello"/>
+<updated>2025-01-02T03:04:05Z</updated><content>Body</content></entry>
+</feed>"""
+
+
+def _rss(n: int) -> str:
+    items = "".join(
+        f"<item><title>Post {i}</title><link>https://example.com/{i}</link>"
+        f"<description>Text {i}</description>"
+        "<pubDate>Tue, 10 Jun 2025 04:00:00 GMT</pubDate></item>"
+        for i in range(n)
+    )
+    return RSS.format(items=items)
+
+
+def test_parse_rss_and_atom() -> None:
+    items = parse_feed(_rss(3))
+    assert [i["url"] for i in items] == [f"https://example.com/{i}" for i in range(3)]
+    assert items[0]["title"] == "Post 0"
+    assert items[0]["published_at"] is not None
+
+    entries = parse_feed(ATOM)
+    assert entries[0]["url"] == "https://example.com/hello"
+    assert entries[0]["content"] == "Body"
+    assert entries[0]["published_at"].year == 2025
+
+
+def test_parse_in_chunks_respects_max_items() -> None:
+    parser = FeedStreamParser(max_items=4)
+    data = _rss(50).encode()
+    done = False
+    for start in range(0, len(data), 64):
+        if parser.feed(data[start : start + 64]):
+            done = True
+            break
+    assert done
+    assert len(parser.close()) == 4
+    assert parser.is_feed
+
+
+def test_stops_after_run_of_known_unchanged_items() -> None:
+    known = {
+        f"https://example.com/{i}": content_fingerprint(f"Post {i}", f"Text {i}")
+        for i in range(2, 50)
+    }
+    # An edited known item is still returned
+    known["https://example.com/1"] = content_fingerprint("Post 1", "Old text")
+    parser = FeedStreamParser(known=known, stop_after_known=3)
+    parser.feed(_rss(50).encode())
+    items = parser.close()
+    assert [i["url"] for i in items] == [
+        "https://example.com/0",
+        "https://example.com/1",
+    ]
+    assert parser.done
+    # Skipped entries still count as read, up to where parsing stopped
+    assert parser.urls == [f"https://example.com/{i}" for i in range(5)]
@@ -0,0 +1,27 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.scraper.scheduler import next_poll_delay, observed_interval
+
+NOW = datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+
+def test_observed_interval_uses_median_gap() -> None:
+    published = [NOW - timedelta(hours=h) for h in (1, 3, 5, 7, 30)]
+    assert observed_interval(published, NOW) == 2 * 3600
+    assert observed_interval(published[:1], NOW) is None
+
+
+def test_observed_interval_backs_off_for_quiet_sources() -> None:
+    published = [NOW - timedelta(days=d) for d in (60, 61, 62)]
+    assert observed_interval(published, NOW) == timedelta(days=60).total_seconds()
+
+
+def test_next_poll_delay_is_bounded_and_jittered() -> None:
+    rng = random.Random(0)
+    bounds = {"min_seconds": 900.0, "max_seconds": 86400.0}
+    assert 900.0 <= next_poll_delay(60.0, rng=rng, **bounds) <= 1.1 * 900
+    assert 0.9 * 86400 <= next_poll_delay(10 * 86400.0, rng=rng, **bounds) <= 86400.0
+    delays = {next_poll_delay(4 * 3600.0, rng=rng, **bounds) for _ in range(20)}
+    assert len(delays) > 1
+    assert all(0.9 * 7200 <= d <= 1.1 * 7200 for d in delays)
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import DateTime, Float, Integer, bindparam
+from sqlmodel import Session, select
+
+from app.scraper.scoring import recency_cutoff_days, score_post, score_posts, score_sql
+
+
+def test_vectorized_scores_match_score_post() -> None:
+    now = datetime.now(timezone.utc)
+    published = [
+        None,
+        now,
+        now - timedelta(days=45, hours=12),
+        now - timedelta(days=400, hours=12),
+        now + timedelta(days=2),
+    ]
+    lengths = [0, 100, 4000, 12000, 2500]
+    weights = [1.0, 1.2, 1.2, 0.5, 2.0]
+    expected = [
+        score_post(published_at=p, content_length=n, source_weight=w)
+        for p, n, w in zip(published, lengths, weights, strict=True)
+    ]
+    published_ts = np.array([np.nan if p is None else p.timestamp() for p in published])
+    scores = score_posts(
+        published_ts, np.array(lengths, dtype=float), np.array(weights), now.timestamp()
+    )
+    assert scores.tolist() == expected
+
+
+def test_sql_scores_match_score_post(db: Session) -> None:
+    now = datetime.now(timezone.utc)
+    # Undated, dated (recent and old) and future posts
+    published = [
+        None,
+        now - timedelta(days=45, hours=12),
+        now - timedelta(days=400, hours=12),
+        now + timedelta(days=2),
+    ]
+    for p in published:
+        expected = score_post(published_at=p, content_length=2500, source_weight=1.2)
+        expression = score_sql(
+            bindparam("published_at", p, type_=DateTime(timezone=True)),
+            bindparam("content_length", 2500, type_=Integer),
+            bindparam("source_weight", 1.2, type_=Float),
+            bindparam("now", now, type_=DateTime(timezone=True)),
+        )
+        assert float(db.exec(select(expression)).one()) == expected
+
+
+def test_scores_are_clamped_to_100() -> None:
+    now = datetime.now(timezone.utc).timestamp()
+    scores = score_posts(np.array([now]), np.array([10_000.0]), np.array([5.0]), now)
+    assert scores.tolist() == [100.0]
+
+
+def test_recency_cutoff_bounds_reachable_scores() -> None:
+    now = datetime.now(timezone.utc)
+    cutoff = recency_cutoff_days(70.0, 1.2)
+    assert cutoff is not None
+    too_old = now - timedelta(days=cutoff + 1)
+    assert (
+        score_post(published_at=too_old, content_length=10_000, source_weight=1.2)
+        < 70.0
+    )
+    # Length alone reaches low scores, so nothing can be excluded
+    assert recency_cutoff_days(40.0, 1.2) is None
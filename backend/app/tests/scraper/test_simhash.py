@@ -0,0 +1,51 @@
+import random
+
+from app.scraper.simhash import SimHashIndex, bands, hamming, simhash
+
+WORDS = "radiology report findings impression contrast lesion chest exam patient normal study".split()
+
+
+def _text(seed: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(400))
+
+
+TEXT = _text(0)
+
+
+def test_simhash_is_stable_and_fits_bigint() -> None:
+    fingerprint = simhash(TEXT)
+    assert fingerprint is not None
+    assert fingerprint == simhash(TEXT)
+    assert -(2**63) <= fingerprint < 2**63
+
+
+def test_simhash_skips_short_text() -> None:
+    assert simhash(None) is None
+    assert simhash("too short to compare") is None
+
+
+def test_near_duplicates_are_close() -> None:
+    original = simhash(TEXT)
+    edited = simhash(TEXT + " signed by the reviewing radiologist")
+    unrelated = simhash(_text(1))
+    assert original is not None and edited is not None and unrelated is not None
+    assert hamming(original, edited) <= 3
+    assert hamming(original, unrelated) > 3
+
+
+def test_index_finds_near_duplicates() -> None:
+    index = SimHashIndex()
+    original = simhash(TEXT)
+    assert original is not None
+    index.add(original, "first")
+    assert index.near(original) == "first"
+    # Flip one bit in each of three bands: still found through the untouched band
+    changed = original ^ (1 | 1 << 20 | 1 << 40)
+    assert index.near(changed) == "first"
+    assert index.near(original ^ (1 | 1 << 20 | 1 << 40 | 1 << 60)) is None
+
+
+def test_bands_cover_all_bits() -> None:
+    assert len(bands(-1)) == 4
+    assert all(band == 0xFFFF for band in bands(-1))
@@ -0,0 +1,41 @@
+from app.scraper.scoring import DEFAULT_SOURCE_WEIGHT
+from app.scraper.sources import SourceConfig, SourceRegistry
+
+
+def _registry(rows: list[SourceConfig]) -> tuple[SourceRegistry, list[int]]:
+    loads: list[int] = []
+
+    def loader() -> list[SourceConfig]:
+        loads.append(1)
+        return list(rows)
+
+    return SourceRegistry(loader, ttl=60), loads
+
+
+def test_registry_caches_until_invalidated() -> None:
+    rows = [SourceConfig("laudite", "https://laudite.com.br", weight=1.5)]
+    registry, loads = _registry(rows)
+    assert registry.weight("laudite") == 1.5
+    assert registry.weight("Laudite") == 1.5
+    assert registry.weight("unknown") == DEFAULT_SOURCE_WEIGHT
+    assert len(loads) == 1
+
+    rows[0] = SourceConfig("laudite", "https://laudite.com.br", weight=2.0)
+    assert registry.weight("laudite") == 1.5
+    registry.invalidate()
+    assert registry.weight("laudite") == 2.0
+    assert len(loads) == 2
+
+
+def test_registry_enabled_companies() -> None:
+    registry, _ = _registry(
+        [
+            SourceConfig("laudite", "https://laudite.com.br"),
+            SourceConfig("leorad", "https://leorad.com.br", enabled=False),
+        ]
+    )
+    assert registry.enabled_companies() == ["laudite"]
+    assert registry.weights() == {
+        "laudite": DEFAULT_SOURCE_WEIGHT,
+        "leorad": DEFAULT_SOURCE_WEIGHT,
+    }
@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+
+from app.scraper.website import scrape_homepage_sources_async
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item><title>First</title><link>https://example.com/posts/1</link></item>
+<item><title>Second</title><link>https://example.com/posts/2</link></item>
+</channel></rss>"""
+
+SITEMAP = """<?xml version="1.0"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>https://example.com/about</loc></url>
+</urlset>"""
+
+
+def _run(handler: httpx.MockTransport) -> list[dict[str, object]]:
+    async def run() -> list[dict[str, object]]:
+        async with httpx.AsyncClient(transport=handler) as client:
+            discovery = await scrape_homepage_sources_async(
+                "https://example.com/", client
+            )
+            return discovery.entries
+
+    return asyncio.run(run())
+
+
+def test_feeds_are_merged_and_deduplicated() -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/":
+            return httpx.Response(
+                200,
+                text='<link rel="alternate" type="application/rss+xml" href="/news.xml">',
+            )
+        if request.url.path in ("/news.xml", "/feed"):
+            return httpx.Response(200, text=RSS)
+        return httpx.Response(404)
+
+    entries = _run(httpx.MockTransport(handler))
+    assert [e["url"] for e in entries] == [
+        "https://example.com/posts/1",
+        "https://example.com/posts/2",
+    ]
+    assert "/news.xml" in requested
+    assert not any(path.startswith("/sitemap") for path in requested)
+
+
+def test_sitemap_fallback_when_no_feed() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/sitemap.xml":
+            return httpx.Response(200, text=SITEMAP)
+        return httpx.Response(404)
+
+    entries = _run(httpx.MockTransport(handler))
+    assert [e["url"] for e in entries] == ["https://example.com/about"]
@@ -0,0 +1,86 @@
+"""Compare the old and new serialization paths of list responses, in rows/sec.
+
+before: one ORM object per row, ``model_validate`` per row, then FastAPI validating
+        the response model again and encoding it with ``json.dumps``.
+after:  plain column dicts (as from a column select), validated and encoded in one
+        pydantic-core pass (``app.api.serialize.dump_json``).
+
+Only serialization is measured; on a real query "after" additionally skips ORM
+object construction. Run from backend/:
+
+    python scripts/benchmark_serialization.py --rows 5000
+"""
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from app.api.serialize import dump_json
+from app.models import ScrapedPost, ScrapedPostPublic, ScrapedPostsPublic
+
+
+def _rows(n: int) -> list[dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "company": "laudite",
+            "platform": "rss",
+            "url": f"https://example.com/posts/{i}",
+            "title": f"Post number {i}",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8,
+            "language": "pt",
+            "published_at": now - timedelta(hours=i),
+            "fetched_at": now,
+            "score": 1.0 / (i + 1),
+            "metadata": {"source": "feed", "tags": ["radiology", "ai"], "rank": i},
+        }
+        for i in range(n)
+    ]
+
+
+def before(rows: list[dict[str, Any]]) -> bytes:
+    items = [ScrapedPost(**row) for row in rows]
+    response = ScrapedPostsPublic(data=[ScrapedPostPublic.model_validate(i) for i in items], count=len(items))
+    # What FastAPI does with a returned model: validate against response_model, then encode
+    response_adapter = TypeAdapter(ScrapedPostsPublic)
+    content = response_adapter.dump_python(response_adapter.validate_python(response), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def after(rows: list[dict[str, Any]]) -> bytes:
+    return dump_json(ScrapedPostsPublic, {"data": rows, "count": len(rows)})
+
+
+def _rate(fn: Callable[[list[dict[str, Any]]], bytes], rows: list[dict[str, Any]], repeat: int) -> float:
+    fn(rows)  # warm up adapters/caches
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    assert json.loads(before(rows)) == json.loads(after(rows))
+    old = _rate(before, rows, args.repeat)
+    new = _rate(after, rows, args.repeat)
+    print(f"before: {old:>12,.0f} rows/sec")
+    print(f"after:  {new:>12,.0f} rows/sec  ({new / old:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()